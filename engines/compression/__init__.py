@@ -15,12 +15,27 @@ Usage:
     compressor = get_compressor("jpeg2000", config)
 """
 
-from typing import Dict, Callable
+import importlib
+from typing import Dict, Callable, Set
 from .base import ImageCompressor
 
 # Global registry of image compressor factories
 COMPRESSOR_REGISTRY: Dict[str, Callable[[dict], ImageCompressor]] = {}
 
+# Modules providing the built-in compressors, keyed by registered name. They are
+# imported on first lookup rather than with this package, so processes
+# (e.g. forked workers) only load and register what they actually use.
+_BUILTIN_MODULES: Dict[str, str] = {
+    'jpeg2000': 'jpeg2000',
+}
+
+# Built-in modules whose import has already been attempted
+_IMPORTED: Set[str] = set()
+
+# ImportError raised by each built-in module that failed to import, re-raised
+# when one of its names is requested
+_IMPORT_ERRORS: Dict[str, ImportError] = {}
+
 
 def register_compressor(name: str):
     """
@@ -45,6 +60,66 @@ def register_compressor(name: str):
     return decorator
 
 
+def _import_builtin(name: str) -> None:
+    """Import the built-in module that registers name, once per process."""
+    module = _BUILTIN_MODULES.get(name)
+    if module is None or module in _IMPORTED:
+        return
+    _IMPORTED.add(module)
+    try:
+        importlib.import_module(f'.{module}', __package__)
+    except ImportError as e:
+        # Dependencies for this compressor are not installed
+        _IMPORT_ERRORS[module] = e
+
+
+def _raise_unregistered(name: str) -> None:
+    """
+    Raise the error for a compressor name that did not register.
+
+    Raises:
+        ImportError: If name is built in but its module failed to import
+                     (chained to the original ImportError)
+        ValueError: If name is not known at all
+    """
+    error = _IMPORT_ERRORS.get(_BUILTIN_MODULES.get(name))
+    if error is not None:
+        raise ImportError(f"Compressor '{name}' is unavailable: {error}") from error
+
+    # Offer only names that actually registered
+    for builtin in _BUILTIN_MODULES:
+        _import_builtin(builtin)
+    raise ValueError(
+        f"Unknown compressor: '{name}'. "
+        f"Available compressors: {', '.join(COMPRESSOR_REGISTRY) or 'none'}"
+    )
+
+
+def get_compressor_factory(name: str) -> Callable[[dict], ImageCompressor]:
+    """
+    Resolve a compressor factory by name without instantiating it.
+
+    Callers that create compressors repeatedly (e.g. one per worker) can
+    resolve the factory once and call it directly.
+
+    Args:
+        name: Compressor identifier (must be registered)
+
+    Returns:
+        Factory callable taking a configuration dictionary
+
+    Raises:
+        ValueError: If compressor name is not registered
+        ImportError: If the built-in compressor's dependencies are not installed
+    """
+    if name not in COMPRESSOR_REGISTRY:
+        _import_builtin(name)
+        if name not in COMPRESSOR_REGISTRY:
+            _raise_unregistered(name)
+
+    return COMPRESSOR_REGISTRY[name]
+
+
 def get_compressor(name: str, config: dict) -> ImageCompressor:
     """
     Get an image compressor instance by name.
@@ -58,19 +133,6 @@ def get_compressor(name: str, config: dict) -> ImageCompressor:
 
     Raises:
         ValueError: If compressor name is not registered
+        ImportError: If the built-in compressor's dependencies are not installed
     """
-    if name not in COMPRESSOR_REGISTRY:
-        available = ', '.join(COMPRESSOR_REGISTRY.keys()) if COMPRESSOR_REGISTRY else 'none'
-        raise ValueError(
-            f"Unknown compressor: '{name}'. "
-            f"Available compressors: {available}"
-        )
-    return COMPRESSOR_REGISTRY[name](config)
-
-
-# Auto-import available compressors to trigger registration
-try:
-    from . import jpeg2000  # noqa: F401
-except ImportError:
-    # Compressor not yet implemented
-    pass
+    return get_compressor_factory(name)(config)
@@ -4,6 +4,7 @@ Image Compressor Protocol for Morphic v0.2
 Defines the contract that all image compression strategies must implement.
 """
 
+from pathlib import Path
 from typing import Protocol, Optional
 from PIL import Image
 
@@ -37,6 +38,25 @@ class ImageCompressor(Protocol):
         """
         ...
 
+    def compress_raw(self, image_path: Path, image_format: str, mode: str) -> Optional[bytes]:
+        """
+        Return an image file's bytes unchanged if they can be embedded as-is.
+
+        Lets callers skip decoding and re-encoding images already stored in
+        this compressor's format. Only the file header needs to be read to
+        know format and mode.
+
+        Args:
+            image_path: Path to the image file
+            image_format: Format reported by PIL (e.g., 'JPEG2000', 'PNG')
+            mode: PIL image mode of the file (e.g., 'RGB')
+
+        Returns:
+            File contents to embed directly, or None if the image must go
+            through compress()
+        """
+        ...
+
     @property
     def filter_name(self) -> str:
         """
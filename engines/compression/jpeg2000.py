@@ -12,11 +12,19 @@ JPEG2000 is essential for Morphic because:
 Requirements:
 - Pillow with OpenJPEG support (pip install Pillow)
 - OpenJPEG library: brew install openjpeg (macOS) or apt-get install libopenjp2-7 (Linux)
+- Optional: glymur (pip install glymur) for direct OpenJPEG encoding with
+  codeblock/precinct/progression control
 """
 
 import io
-from typing import Optional
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
 from PIL import Image
+import numpy as np
 
 from . import register_compressor
 
@@ -26,7 +34,46 @@ from pathlib import Path
 repo_root = Path(__file__).resolve().parent.parent.parent
 if str(repo_root) not in sys.path:
     sys.path.insert(0, str(repo_root))
-from utilities import Print
+from utilities import Print, debug_enabled
+
+# Try to import glymur for direct OpenJPEG encoding
+# glymur loads libopenjp2 via ctypes; without it, it can only read metadata
+try:
+    import glymur
+    GLYMUR_AVAILABLE = glymur.version.openjpeg_version_tuple[0] >= 2
+except ImportError:
+    GLYMUR_AVAILABLE = False
+
+
+def _probe_jpeg2000_support() -> Optional[str]:
+    """
+    Check once whether Pillow has JPEG2000 encoding support.
+
+    Returns:
+        None if encoding works, otherwise an error message with install hints
+    """
+    # Check if JPEG2000 is in supported formats
+    if 'JPEG2000' not in Image.registered_extensions().values():
+        # Try to encode a test image to verify
+        test_img = Image.new('RGB', (10, 10), color='white')
+        buffer = io.BytesIO()
+        try:
+            test_img.save(buffer, format='JPEG2000')
+        except Exception as e:
+            return (
+                f"JPEG2000 encoding not available: {e}\n"
+                f"Install OpenJPEG library:\n"
+                f"  macOS: brew install openjpeg\n"
+                f"  Linux: apt-get install libopenjp2-7\n"
+                f"Then reinstall Pillow: pip install --force-reinstall Pillow"
+            )
+
+    Print("DEBUG", "JPEG2000 encoding verified")
+    return None
+
+
+# Result of the import-time probe; compressors raise this message if set
+_JP2K_ERROR = _probe_jpeg2000_support()
 
 
 @register_compressor("jpeg2000")
@@ -50,6 +97,7 @@ class JPEG2000Compressor:
         quality_layers: List of quality values for progressive encoding
         quality_mode: Either 'rates' (compression ratio) or 'dB' (PSNR)
         irreversible: If True, use lossy DWT (better compression)
+        backend: 'glymur' (OpenJPEG directly) or 'pillow'
     """
 
     def __init__(self, config: dict):
@@ -61,38 +109,68 @@ class JPEG2000Compressor:
                 - quality_layers: List[int] - Quality values (default: [50])
                 - quality_mode: str - 'rates' or 'dB' (default: 'rates')
                 - irreversible: bool - Use lossy transform (default: True)
+                - tile_size: [int, int] - Tile width/height in pixels (default: [1024, 1024])
+                - backend: str - 'pillow', 'glymur' or 'auto' (default: 'pillow';
+                  'auto' uses glymur when it can reach OpenJPEG)
+                - num_resolutions: int - DWT decomposition levels + 1 (default: 6, glymur only)
+                - codeblock_size: [int, int] - Codeblock size (default: [64, 64], glymur only)
+                - precinct_sizes: List[[int, int]] - Precinct sizes (default: none, glymur only)
+                - progression_order: str - e.g. 'LRCP', 'RLCP' (default: 'LRCP', glymur only)
+                - reversible_for_binary: bool - Encode near-binary pages losslessly
+                  with the 5/3 wavelet (default: False)
+                - binary_max_levels: int - Most distinct colors a page may have to
+                  count as near-binary (default: 8)
+                - encoder_threads: int - OpenJPEG threads per encode (default: 1,
+                  glymur only; pages are already encoded in parallel processes)
         """
         self.quality_layers = config.get('quality_layers', [50])
         self.quality_mode = config.get('quality_mode', 'rates')
         self.irreversible = config.get('irreversible', True)
 
-        # Verify JPEG2000 support at initialization
-        self._verify_jpeg2000_support()
-
-    def _verify_jpeg2000_support(self) -> None:
-        """
-        Verify that Pillow has JPEG2000 encoding support.
-
-        Raises:
-            RuntimeError: If JPEG2000 encoding is not available
-        """
-        # Check if JPEG2000 is in supported formats
-        if 'JPEG2000' not in Image.registered_extensions().values():
-            # Try to encode a test image to verify
-            test_img = Image.new('RGB', (10, 10), color='white')
-            buffer = io.BytesIO()
-            try:
-                test_img.save(buffer, format='JPEG2000')
-            except Exception as e:
-                raise RuntimeError(
-                    f"JPEG2000 encoding not available: {e}\n"
-                    f"Install OpenJPEG library:\n"
-                    f"  macOS: brew install openjpeg\n"
-                    f"  Linux: apt-get install libopenjp2-7\n"
-                    f"Then reinstall Pillow: pip install --force-reinstall Pillow"
-                )
-
-        Print("DEBUG", "JPEG2000 encoding verified")
+        # Encode large pages as independent tiles so the DWT working set
+        # (~1024x1024 x 3 components x int32) stays cache-resident instead
+        # of streaming a whole 600 DPI frame through every filter pass
+        tile_size = config.get('tile_size', (1024, 1024))
+        self.tile_size = tuple(tile_size) if tile_size else None
+
+        # Pillow stays the default encoder; glymur is opt-in
+        backend = config.get('backend', 'pillow')
+        if backend == 'auto':
+            backend = 'glymur' if GLYMUR_AVAILABLE else 'pillow'
+        elif backend == 'glymur' and not GLYMUR_AVAILABLE:
+            Print("WARNING", "glymur/OpenJPEG not available, falling back to Pillow for JPEG2000")
+            backend = 'pillow'
+        self.backend = backend
+
+        # OpenJPEG >= 2.4 encodes code blocks on a thread pool. glymur's
+        # option is process-wide, which matches one compressor per process.
+        self.encoder_threads = config.get('encoder_threads', 1)
+        if self.backend == 'glymur' and self.encoder_threads > 1:
+            glymur.set_option('lib.num_threads', self.encoder_threads)
+
+        self.num_resolutions = config.get('num_resolutions', 6)
+        self.codeblock_size = tuple(config.get('codeblock_size', (64, 64)))
+        precinct_sizes = config.get('precinct_sizes')
+        self.precinct_sizes = [tuple(size) for size in precinct_sizes] if precinct_sizes else None
+        self.progression_order = config.get('progression_order', 'LRCP')
+
+        # The integer 5/3 lifting is cheaper than the floating-point 9/7
+        # transform, but a lossless binarized text page comes out ~3x larger
+        # than a lossy one at the default rate, so this is opt-in for when
+        # exact black-on-white reproduction matters more than size
+        self.reversible_for_binary = config.get('reversible_for_binary', False)
+        self.binary_max_levels = config.get('binary_max_levels', 8)
+
+        # Per-thread output buffer reused across pages (see _output_buffer)
+        self._local = threading.local()
+
+        # Encoder parameters per (page size, quality); pages of one document
+        # almost always share both, so they are worked out once
+        self._encode_args_cache: Dict[tuple, dict] = {}
+
+        # JPEG2000 support is probed once at import, not per instance
+        if _JP2K_ERROR:
+            raise RuntimeError(_JP2K_ERROR)
 
     def compress(self, image: Image.Image, quality: Optional[int] = None) -> bytes:
         """
@@ -110,61 +188,144 @@ class JPEG2000Compressor:
         Raises:
             RuntimeError: If compression fails
         """
+        image, quality = self._prepare(image, quality)
+        return self._encode(image, quality)
+
+    def compress_into(
+        self,
+        image: Image.Image,
+        out: bytearray,
+        quality: Optional[int] = None
+    ) -> int:
+        """
+        Compress image to JPEG2000 and append the codestream to out.
+
+        For callers assembling a larger buffer (e.g. a PDF stream), this
+        copies the encoder output straight from the internal buffer into
+        theirs instead of materializing an intermediate bytes object first.
+
+        Args:
+            image: PIL Image to compress (will be converted to RGB if needed)
+            out: Buffer the compressed data is appended to
+            quality: Optional quality override, as for compress()
+
+        Returns:
+            Number of bytes appended
+
+        Raises:
+            RuntimeError: If compression fails
+        """
+        image, quality = self._prepare(image, quality)
+        start = len(out)
+        self._encode(image, quality, out)
+        return len(out) - start
+
+    def compress_raw(self, image_path: Path, image_format: str, mode: str) -> Optional[bytes]:
+        """
+        Pass an existing JPEG2000 file through without re-encoding.
+
+        Only RGB files qualify, since the PDF image is tagged DeviceRGB. The
+        file keeps its own compression settings; quality is not reapplied.
+
+        Args:
+            image_path: Path to the image file
+            image_format: Format reported by PIL
+            mode: PIL image mode of the file
+
+        Returns:
+            The file's bytes, or None if it has to be compressed normally
+        """
+        if image_format != 'JPEG2000' or mode != 'RGB':
+            return None
+        if debug_enabled():
+            Print("DEBUG", f"Embedding {image_path.name} as-is (already JPEG2000)")
+        return image_path.read_bytes()
+
+    def _prepare(
+        self,
+        image: Image.Image,
+        quality: Optional[int]
+    ) -> Tuple[Image.Image, Optional[int]]:
+        """
+        Convert image to RGB and choose the encoding quality.
+
+        Returns:
+            Tuple of (RGB image, quality; None for lossless 5/3 encoding)
+        """
         if quality is None:
             quality = self.quality_layers[0]
 
         # Ensure RGB mode (JPEG2000 doesn't support RGBA well in PDFs)
-        if image.mode == 'RGBA':
-            # Composite onto white background
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[3])  # Use alpha as mask
-            image = background
-            Print("DEBUG", "Converted RGBA to RGB for JPEG2000")
-        elif image.mode == 'LA':
-            # Grayscale with alpha
-            background = Image.new('L', image.size, 255)
-            background.paste(image, mask=image.split()[1])
-            image = background.convert('RGB')
-            Print("DEBUG", "Converted LA to RGB for JPEG2000")
+        if image.mode in ('RGBA', 'LA') and image.getextrema()[-1][0] == 255:
+            # Fully opaque: per-band extrema need no band copies, and
+            # dropping alpha is much cheaper than compositing
+            image = image.convert('RGB')
+        elif image.mode in ('RGBA', 'LA'):
+            # Composite onto white background in one C pass (no split() band copies)
+            source_mode = image.mode
+            background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+            image = Image.alpha_composite(background, image.convert('RGBA')).convert('RGB')
+            Print("DEBUG", f"Converted {source_mode} to RGB for JPEG2000")
         elif image.mode == 'P':
-            # Palette mode
+            # Palette mode: one C palette lookup per pixel (faster than a
+            # NumPy palette[arr] gather plus the copy back into Pillow)
             image = image.convert('RGB')
             Print("DEBUG", "Converted palette to RGB for JPEG2000")
         elif image.mode == 'L':
-            # Grayscale - convert to RGB for consistency
+            # Grayscale - convert to RGB for consistency. Pillow replicates
+            # the band in C; np.broadcast_to + ascontiguousarray is slower
             image = image.convert('RGB')
             Print("DEBUG", "Converted grayscale to RGB for JPEG2000")
         elif image.mode != 'RGB':
             image = image.convert('RGB')
             Print("DEBUG", f"Converted {image.mode} to RGB for JPEG2000")
 
-        buffer = io.BytesIO()
+        if self.reversible_for_binary and self._is_near_binary(image):
+            # None selects lossless 5/3 encoding in the backends
+            quality = None
+            if debug_enabled():
+                Print("DEBUG", "Near-binary page: encoding losslessly with the 5/3 wavelet")
 
-        try:
-            # Pillow JPEG2000 encoding parameters
-            # See: https://pillow.readthedocs.io/en/stable/handbook/image-file-formats.html#jpeg-2000
-            image.save(
-                buffer,
-                format='JPEG2000',
-                quality_mode=self.quality_mode,
-                quality_layers=[quality],
-                irreversible=self.irreversible
-            )
+        return image, quality
 
-            compressed_bytes = buffer.getvalue()
+    def _encode(
+        self,
+        image: Image.Image,
+        quality: Optional[int],
+        out: Optional[bytearray] = None
+    ) -> Optional[bytes]:
+        """
+        Encode a prepared RGB image with the configured backend.
+
+        Returns the compressed bytes, or appends them to out and returns None.
+        """
+        try:
+            if self.backend == 'glymur':
+                compressed_bytes = self._encode_glymur(image, quality)
+                compressed_size = len(compressed_bytes)
+                if out is not None:
+                    out += compressed_bytes
+            else:
+                buffer = self._encode_pillow(image, quality)
+                compressed_size = buffer.tell()
+                if out is None:
+                    compressed_bytes = buffer.getvalue()
+                else:
+                    with buffer.getbuffer() as view:
+                        out += view
 
             # Log compression stats
-            original_size = image.width * image.height * 3  # RGB = 3 bytes/pixel
-            compressed_size = len(compressed_bytes)
-            ratio = original_size / compressed_size if compressed_size > 0 else 0
-
-            Print("DEBUG",
-                f"JPEG2000: {image.width}x{image.height} compressed "
-                f"{original_size:,} -> {compressed_size:,} bytes "
-                f"(ratio: {ratio:.1f}:1)"
-            )
+            if debug_enabled():
+                original_size = image.width * image.height * 3  # RGB = 3 bytes/pixel
+                ratio = original_size / compressed_size if compressed_size > 0 else 0
+
+                Print("DEBUG",
+                    f"JPEG2000: {image.width}x{image.height} compressed "
+                    f"{original_size:,} -> {compressed_size:,} bytes "
+                    f"(ratio: {ratio:.1f}:1)"
+                )
 
-            return compressed_bytes
+            return compressed_bytes if out is None else None
 
         except Exception as e:
             raise RuntimeError(
@@ -173,6 +334,189 @@ class JPEG2000Compressor:
                 f"Quality: {quality}, mode: {self.quality_mode}"
             )
 
+    def compress_many(
+        self,
+        images: List[Image.Image],
+        quality: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False
+    ) -> List[bytes]:
+        """
+        Compress several images concurrently.
+
+        OpenJPEG does the DWT and entropy coding with the GIL released (both
+        Pillow's encoder and glymur's ctypes calls drop it), so a thread pool
+        scales with cores without pickling pages to worker processes. A
+        process pool is available for builds where the encoder holds the GIL.
+
+        Args:
+            images: PIL Images to compress, in page order
+            quality: Optional quality override, as for compress()
+            max_workers: Number of concurrent encodes (default: os.cpu_count())
+            use_processes: Use a ProcessPoolExecutor instead of threads
+
+        Returns:
+            List of JPEG2000 byte strings, in the same order as images
+
+        Raises:
+            RuntimeError: If compression fails for any image
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(images))
+        if workers <= 1:
+            return [self.compress(image, quality) for image in images]
+
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=workers) as executor:
+            return list(executor.map(self.compress, images, repeat(quality)))
+
+    def _is_near_binary(self, image: Image.Image) -> bool:
+        """
+        True if a 1/16 nearest-neighbour sample of the page has at most
+        binary_max_levels distinct colors.
+
+        getcolors() gives up as soon as the limit is exceeded, so ordinary
+        scans with sensor noise are rejected after a few hundred pixels.
+        """
+        sample = image.resize(
+            (max(1, image.width // 4), max(1, image.height // 4)),
+            Image.NEAREST
+        )
+        return sample.getcolors(self.binary_max_levels) is not None
+
+    def _tile_size_for(self, size: Tuple[int, int]) -> Optional[tuple]:
+        """
+        Tile size (width, height) to use for an image size, or None for a single tile.
+
+        Tiles are clamped to the image so small pages are encoded whole.
+        """
+        if not self.tile_size:
+            return None
+
+        tile_size = (min(self.tile_size[0], size[0]), min(self.tile_size[1], size[1]))
+        if tile_size == size:
+            return None
+        return tile_size
+
+    def _encode_args(self, size: Tuple[int, int], quality: Optional[int]) -> dict:
+        """
+        Encoder keyword arguments for the backend, for an image size and quality.
+
+        Cached per (size, quality); callers must not modify the result.
+        """
+        key = (size, quality)
+        encode_args = self._encode_args_cache.get(key)
+        if encode_args is None:
+            if self.backend == 'glymur':
+                encode_args = self._glymur_encode_args(size, quality)
+            else:
+                encode_args = self._pillow_encode_args(size, quality)
+            self._encode_args_cache[key] = encode_args
+        return encode_args
+
+    def _pillow_encode_args(self, size: Tuple[int, int], quality: Optional[int]) -> dict:
+        """Image.save() arguments for Pillow's OpenJPEG plugin (quality None = lossless)."""
+        # Pillow leaves the multiple component transform off by default, so
+        # near-gray document pages paid for three full, highly correlated
+        # components. mct=1 applies OpenJPEG's integer RCT (lossless) or
+        # YCbCr ICT (lossy) inside the codec, as glymur already does for RGB.
+        if quality is None:
+            encode_args = dict(irreversible=False, mct=1)
+        else:
+            encode_args = dict(
+                quality_mode=self.quality_mode,
+                quality_layers=[quality],
+                irreversible=self.irreversible,
+                mct=1,
+            )
+        tile_size = self._tile_size_for(size)
+        if tile_size:
+            encode_args['tile_size'] = tile_size
+            encode_args['tile_offset'] = (0, 0)
+        return encode_args
+
+    def _glymur_encode_args(self, size: Tuple[int, int], quality: Optional[int]) -> dict:
+        """glymur.Jp2k() arguments (quality None = lossless)."""
+        tile_size = self._tile_size_for(size)
+
+        # Each resolution level halves the tile; OpenJPEG rejects levels
+        # that would shrink the smallest side below one pixel
+        num_resolutions = min(self.num_resolutions, min(tile_size or size).bit_length())
+
+        encode_args = dict(
+            irreversible=self.irreversible if quality is not None else False,
+            numres=num_resolutions,
+            cbsize=self.codeblock_size,
+            prog=self.progression_order,
+        )
+        if tile_size:
+            # glymur takes (rows, columns)
+            encode_args['tilesize'] = (tile_size[1], tile_size[0])
+        if self.precinct_sizes:
+            encode_args['psizes'] = self.precinct_sizes
+        if quality is None:
+            pass  # no rate target: all coding passes are kept
+        elif self.quality_mode == 'dB':
+            encode_args['psnr'] = [quality]
+        else:
+            encode_args['cratios'] = [quality]
+        return encode_args
+
+    def __getstate__(self) -> dict:
+        """Pickle support for process pools; thread-local buffers stay behind."""
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _output_buffer(self) -> io.BytesIO:
+        """
+        Return this thread's encode buffer, emptied and ready for reuse.
+
+        Reusing one buffer per thread avoids allocating and growing a fresh
+        multi-megabyte BytesIO for every page.
+        """
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._local.buffer = io.BytesIO()
+        else:
+            buffer.seek(0)
+            buffer.truncate(0)
+        return buffer
+
+    def _encode_pillow(self, image: Image.Image, quality: Optional[int]) -> io.BytesIO:
+        """
+        Encode an RGB image through Pillow's OpenJPEG plugin (quality None = lossless).
+
+        Returns this thread's reusable buffer holding the codestream; read it
+        before the next encode on the same thread.
+        """
+        buffer = self._output_buffer()
+
+        # Pillow JPEG2000 encoding parameters
+        # See: https://pillow.readthedocs.io/en/stable/handbook/image-file-formats.html#jpeg-2000
+        image.save(buffer, format='JPEG2000', **self._encode_args(image.size, quality))
+
+        return buffer
+
+    def _encode_glymur(self, image: Image.Image, quality: Optional[int]) -> bytes:
+        """
+        Encode an RGB image with OpenJPEG through glymur.
+
+        glymur hands the NumPy pixel array straight to libopenjp2 and exposes
+        codestream parameters (codeblock size, precincts, progression order)
+        that Pillow does not. It can only write to a file, so the codestream
+        goes through a temporary file. quality None encodes losslessly.
+        """
+        encode_args = self._encode_args(image.size, quality)
+
+        with tempfile.TemporaryDirectory(prefix='morphic_jp2_') as temp_dir:
+            jp2_path = Path(temp_dir) / 'page.jp2'
+            glymur.Jp2k(str(jp2_path), data=np.asarray(image), **encode_args)
+            return jp2_path.read_bytes()
+
     @property
     def filter_name(self) -> str:
         """
@@ -16,12 +16,28 @@ Usage:
     engine = get_ocr_engine("tesseract", config)
 """
 
-from typing import Dict, Callable
+import importlib
+from typing import Dict, Callable, Set
 from .base import OCREngine
 
 # Global registry of OCR engine factories
 OCR_REGISTRY: Dict[str, Callable[[dict], OCREngine]] = {}
 
+# Modules providing the built-in engines, keyed by registered name. They are
+# imported on first lookup rather than with this package, so processes
+# (e.g. forked workers) only load and register what they actually use.
+_BUILTIN_MODULES: Dict[str, str] = {
+    'tesseract': 'tesseract',
+    'tesserocr': 'tesserocr_engine',
+}
+
+# Built-in modules whose import has already been attempted
+_IMPORTED: Set[str] = set()
+
+# ImportError raised by each built-in module that failed to import, re-raised
+# when one of its names is requested
+_IMPORT_ERRORS: Dict[str, ImportError] = {}
+
 
 def register_ocr_engine(name: str):
     """
@@ -46,6 +62,66 @@ def register_ocr_engine(name: str):
     return decorator
 
 
+def _import_builtin(name: str) -> None:
+    """Import the built-in module that registers name, once per process."""
+    module = _BUILTIN_MODULES.get(name)
+    if module is None or module in _IMPORTED:
+        return
+    _IMPORTED.add(module)
+    try:
+        importlib.import_module(f'.{module}', __package__)
+    except ImportError as e:
+        # Dependencies for this engine are not installed
+        _IMPORT_ERRORS[module] = e
+
+
+def _raise_unregistered(name: str) -> None:
+    """
+    Raise the error for a OCR engine name that did not register.
+
+    Raises:
+        ImportError: If name is built in but its module failed to import
+                     (chained to the original ImportError)
+        ValueError: If name is not known at all
+    """
+    error = _IMPORT_ERRORS.get(_BUILTIN_MODULES.get(name))
+    if error is not None:
+        raise ImportError(f"OCR engine '{name}' is unavailable: {error}") from error
+
+    # Offer only names that actually registered
+    for builtin in _BUILTIN_MODULES:
+        _import_builtin(builtin)
+    raise ValueError(
+        f"Unknown OCR engine: '{name}'. "
+        f"Available engines: {', '.join(OCR_REGISTRY) or 'none'}"
+    )
+
+
+def get_ocr_engine_factory(name: str) -> Callable[[dict], OCREngine]:
+    """
+    Resolve an OCR engine factory by name without instantiating it.
+
+    Callers that create engines repeatedly (e.g. one per worker) can
+    resolve the factory once and call it directly.
+
+    Args:
+        name: Engine identifier (must be registered)
+
+    Returns:
+        Factory callable taking a configuration dictionary
+
+    Raises:
+        ValueError: If engine name is not registered
+        ImportError: If the built-in OCR engine's dependencies are not installed
+    """
+    if name not in OCR_REGISTRY:
+        _import_builtin(name)
+        if name not in OCR_REGISTRY:
+            _raise_unregistered(name)
+
+    return OCR_REGISTRY[name]
+
+
 def get_ocr_engine(name: str, config: dict) -> OCREngine:
     """
     Get an OCR engine instance by name.
@@ -59,20 +135,6 @@ def get_ocr_engine(name: str, config: dict) -> OCREngine:
 
     Raises:
         ValueError: If engine name is not registered
+        ImportError: If the built-in OCR engine's dependencies are not installed
     """
-    if name not in OCR_REGISTRY:
-        available = ', '.join(OCR_REGISTRY.keys()) if OCR_REGISTRY else 'none'
-        raise ValueError(
-            f"Unknown OCR engine: '{name}'. "
-            f"Available engines: {available}"
-        )
-    return OCR_REGISTRY[name](config)
-
-
-# Auto-import available engines to trigger registration
-# Engines will register themselves via @register_ocr_engine decorator
-try:
-    from . import tesseract  # noqa: F401
-except ImportError:
-    # Engine not yet implemented
-    pass
+    return get_ocr_engine_factory(name)(config)
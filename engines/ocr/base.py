@@ -64,6 +64,26 @@ class OCREngine(Protocol):
         """
         ...
 
+    def recognize_to_hocr_bytes(
+        self,
+        image: Image.Image,
+        language: str = "eng"
+    ) -> bytes:
+        """
+        Run OCR and return the hOCR document without writing it to disk.
+
+        Args:
+            image: PIL Image to perform OCR on
+            language: ISO 639-2 language code (e.g., 'eng', 'fra')
+
+        Returns:
+            hOCR document as UTF-8 bytes
+
+        Raises:
+            RuntimeError: If OCR fails
+        """
+        ...
+
     @property
     def name(self) -> str:
         """
@@ -14,13 +14,118 @@ Original authors: James R. Barlow and contributors
 License: MIT/MPL-2.0
 """
 
-from typing import Optional
+import functools
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, FrozenSet, List, Optional, Tuple
 from PIL import Image
+from lxml import etree
 import subprocess
 from pathlib import Path
 import tempfile
 from . import register_ocr_engine
-from utilities import Print
+from utilities import Print, debug_enabled
+
+
+# Pipes created by Python are non-inheritable (PEP 446), so on POSIX the OCR
+# child needs no close-every-descriptor pass before exec
+_CLOSE_FDS = os.name != 'posix'
+
+# Only this much of Tesseract's stderr is scanned for debug logging
+_STDERR_LOG_LIMIT = 64 * 1024
+
+# stderr lines not worth logging: the version banner and Leptonica noise
+# (often spurious)
+_STDERR_SKIP_RE = re.compile(rb'^Tesseract Open Source|Leptonica Error|fopenReadStream')
+
+# Page divs in a multi-page hOCR document, compiled once
+_PAGE_XPATH = etree.XPath('//*[@class="ocr_page"]')
+
+# hOCR bounding box property: "bbox x1 y1 x2 y2"
+_BBOX_RE = re.compile(rb'bbox (\d+) (\d+) (\d+) (\d+)')
+
+def _encode_pnm(image: Image.Image) -> bytes:
+    """
+    Encode an 'L' or 'RGB' image as binary PGM/PPM.
+
+    PNM is a short text header followed by the raw pixel rows exactly as
+    Pillow stores them, so this is a single tobytes() copy with no encoder
+    pass. Leptonica reads it natively from Tesseract's stdin.
+    """
+    magic = b'P5' if image.mode == 'L' else b'P6'
+    return b'%s\n%d %d\n255\n' % (magic, image.width, image.height) + image.tobytes()
+
+
+def _binary_mtime(tesseract_path: str) -> Optional[float]:
+    """Modification time of the resolved Tesseract binary, or None if not found."""
+    resolved = shutil.which(tesseract_path)
+    if resolved is None:
+        return None
+    try:
+        return os.path.getmtime(resolved)
+    except OSError:
+        return None
+
+
+# Probe results are shared by every engine instance. They are keyed on the
+# binary's mtime as well as its path, so a replaced (e.g. upgraded) binary
+# is probed again. Failed probes raise and are therefore not cached.
+
+@functools.lru_cache(maxsize=8)
+def _probe_version(tesseract_path: str, binary_mtime: Optional[float]) -> str:
+    """First line of 'tesseract --version', e.g. 'tesseract 5.3.0'."""
+    result = subprocess.run(
+        [tesseract_path, '--version'],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=5
+    )
+    return result.stdout.split('\n')[0]
+
+
+@functools.lru_cache(maxsize=8)
+def _probe_langs(tesseract_path: str, binary_mtime: Optional[float]) -> FrozenSet[str]:
+    """
+    Languages reported by 'tesseract --list-langs'.
+
+    Adapted from ocrmypdf/_exec/tesseract.py:get_languages()
+    """
+    result = subprocess.run(
+        [tesseract_path, '--list-langs'],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=5
+    )
+
+    # Parse available languages from output
+    # Format is:
+    # List of available languages (X):
+    # eng
+    # fra
+    # ...
+    return frozenset(
+        line for line in map(str.strip, result.stdout.splitlines())
+        if line and not line.startswith('List of')
+    )
+
+
+def _default_temp_root() -> Path:
+    """
+    Directory for OCR scratch files.
+
+    /dev/shm is RAM-backed tmpfs on Linux, so page images and hOCR never hit
+    the disk or compete for writeback. Elsewhere /var/tmp is used - it is
+    more reliable on macOS than /tmp (which is symlinked to /private/tmp and
+    can cause Tesseract access issues).
+    """
+    shm = Path('/dev/shm')
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+    return Path('/var/tmp')
 
 
 @register_ocr_engine("tesseract")
@@ -35,9 +140,22 @@ class TesseractEngineFactory:
         Args:
             config: Configuration dictionary with:
                 - binary_path: Path to tesseract binary (default: 'tesseract')
-                - oem: OCR Engine Mode (default: 3 for LSTM)
+                - oem: OCR Engine Mode (default: 1, LSTM only)
                 - psm: Page Segmentation Mode (default: 3 for auto)
                 - language: Language code (default: 'eng')
+                - ocr_dpi: Downscale pages above this DPI before OCR (default: off)
+                - source_dpi: DPI assumed for images without DPI metadata
+                - strict_lang_check: Verify 'eng' with --list-langs too (default: False)
+                - max_megapixels: Pixel budget per page at OCR resolution
+                                 (default: 40; 0 disables the check)
+                - auto_downscale: Shrink pages over max_megapixels instead of
+                                 raising ValueError (default: True)
+                - grayscale: Send pages to Tesseract as 8-bit grayscale
+                            (default: True; False keeps color pages in RGB)
+                - omp_thread_limit: OpenMP threads per Tesseract process
+                                   (default: 1; 0 leaves the environment alone)
+                - temp_dir: Scratch directory (default: /dev/shm/morphic if
+                           available, else /var/tmp/morphic)
 
         Returns:
             Initialized TesseractEngine instance
@@ -65,10 +183,43 @@ class TesseractEngine:
         """
         self.config = config
         self.tesseract_path = config.get('binary_path', 'tesseract')
-        self.oem = config.get('oem', 3)  # LSTM neural nets
+        self.oem = config.get('oem', 1)  # LSTM only; never loads the legacy engine
         self.psm = config.get('psm', 3)  # Fully automatic page segmentation
         self.language = config.get('language', 'eng')
+        # Optional OCR resolution: pages above it are downscaled before OCR
+        # (the LSTM is trained on ~300 DPI text) and hOCR boxes are mapped
+        # back to the original resolution. None keeps full-resolution OCR.
+        self.ocr_dpi = config.get('ocr_dpi')
+        self.source_dpi = config.get('source_dpi')
+        # Pages far above this would likely hit the OCR timeout anyway
+        self.max_megapixels = config.get('max_megapixels', 40)
+        self.auto_downscale = config.get('auto_downscale', True)
+        self.strict_lang_check = config.get('strict_lang_check', False)
+        self.grayscale = config.get('grayscale', True)
+
+        # Tesseract's OpenMP threading scales poorly within a page and badly
+        # oversubscribes cores when pages run side by side, so every child
+        # process gets a single thread; throughput comes from running pages
+        # in parallel (recognize_many). Built once, reused for every run.
+        omp_threads = config.get('omp_thread_limit', 1)
+        self._env = {**os.environ, 'OMP_THREAD_LIMIT': str(omp_threads)} if omp_threads else None
         self._version = None
+        self._binary_mtime = None
+        # Scratch files live in RAM when tmpfs is available. Each worker holds
+        # at most one page there at a time (a 600 DPI letter page is ~34 MB
+        # as grayscale BMP), so size /dev/shm for workers x one page.
+        # Created here once rather than with a mkdir syscall on every page
+        self._temp_dir = Path(config.get('temp_dir') or _default_temp_root() / 'morphic')
+        self._temp_dir.mkdir(exist_ok=True, parents=True)
+
+        # Command-line arguments after the input/output pair never change for
+        # the configured language, so build them once instead of per page
+        self._cmd_tail = (
+            '-l', self.language,
+            '--oem', str(self.oem),
+            '--psm', str(self.psm),
+            'hocr'  # Output format
+        )
 
     def initialize(self, config: dict) -> None:
         """
@@ -83,14 +234,13 @@ class TesseractEngine:
             RuntimeError: If Tesseract is not found or version is incompatible
         """
         try:
-            result = subprocess.run(
-                [self.tesseract_path, '--version'],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5
-            )
-            version_line = result.stdout.split('\n')[0]
+            # Resolve PATH once so every per-page exec skips the PATH search
+            self.tesseract_path = shutil.which(self.tesseract_path) or self.tesseract_path
+
+            # Reuse probe results from an earlier engine on the same binary
+            self._binary_mtime = _binary_mtime(self.tesseract_path)
+            version_line = _probe_version(self.tesseract_path, self._binary_mtime)
+
             self._version = version_line
             Print("SUCCESS", f"Found {version_line}")
 
@@ -107,8 +257,13 @@ class TesseractEngine:
                     except (ValueError, IndexError):
                         Print("WARNING", f"Could not parse Tesseract version: {version_str}")
 
-            # Verify language is available
-            self._verify_language(self.language)
+            # Verify language is available. 'eng' ships with every Tesseract
+            # install, so the --list-langs subprocess is skipped for it unless
+            # strict_lang_check is set
+            if self.language != 'eng' or self.strict_lang_check:
+                available_langs = self._list_languages()
+                if available_langs is not None:
+                    self._verify_language(self.language, available_langs)
 
         except FileNotFoundError:
             raise RuntimeError(
@@ -122,52 +277,41 @@ class TesseractEngine:
         except Exception as e:
             raise RuntimeError(f"Tesseract initialization failed: {e}")
 
-    def _verify_language(self, language: str) -> None:
+    def _list_languages(self) -> Optional[FrozenSet[str]]:
         """
-        Verify that the specified language is available.
+        Query the languages installed for this Tesseract binary.
+
+        Returns:
+            Set of language codes, or None if they could not be determined
+        """
+        try:
+            return _probe_langs(self.tesseract_path, self._binary_mtime)
+        except subprocess.TimeoutExpired:
+            Print("WARNING", "Could not verify language (timeout), proceeding anyway")
+            return None
+        except subprocess.CalledProcessError as e:
+            Print("WARNING", f"Could not verify language: {e.stderr}")
+            return None
 
-        Adapted from ocrmypdf/_exec/tesseract.py:get_languages()
+    def _verify_language(self, language: str, available_langs: Collection[str]) -> None:
+        """
+        Verify that the specified language is available.
 
         Args:
             language: Language code to verify (e.g., 'eng')
+            available_langs: Languages reported by --list-langs
 
         Raises:
             RuntimeError: If language is not available
         """
-        try:
-            result = subprocess.run(
-                [self.tesseract_path, '--list-langs'],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5
+        if language not in available_langs:
+            raise RuntimeError(
+                f"Tesseract language '{language}' not available. "
+                f"Available: {', '.join(sorted(available_langs))}. "
+                f"Install: brew install tesseract-lang (macOS)"
             )
 
-            # Parse available languages from output
-            # Format is:
-            # List of available languages (X):
-            # eng
-            # fra
-            # ...
-            available_langs = []
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('List of'):
-                    available_langs.append(line)
-
-            if language not in available_langs:
-                raise RuntimeError(
-                    f"Tesseract language '{language}' not available. "
-                    f"Available: {', '.join(available_langs)}. "
-                    f"Install: brew install tesseract-lang (macOS)"
-                )
-
-            Print("DEBUG", f"Language '{language}' verified")
-
-        except subprocess.TimeoutExpired:
-            Print("WARNING", "Could not verify language (timeout), proceeding anyway")
-        except subprocess.CalledProcessError as e:
-            Print("WARNING", f"Could not verify language: {e.stderr}")
+        Print("DEBUG", f"Language '{language}' verified")
 
     def recognize_to_hocr(
         self,
@@ -179,7 +323,9 @@ class TesseractEngine:
         Run Tesseract and return path to hOCR file.
 
         Adapted from ocrmypdf/_exec/tesseract.py:generate_hocr()
-        Key change: Simplified to not use ocrmypdf's subprocess wrapper.
+        Key change: the image is piped to Tesseract's stdin as raw PNM
+        instead of being written to disk as PNG, so no DEFLATE encode and
+        decode is spent on the bitmap.
 
         Args:
             image: PIL Image to OCR
@@ -191,109 +337,519 @@ class TesseractEngine:
 
         Raises:
             RuntimeError: If OCR fails
+            ValueError: If the image is too large and auto_downscale is off
+        """
+        return self._recognize(image, language, output_path)
+
+    def recognize_to_hocr_bytes(
+        self,
+        image: Image.Image,
+        language: str = "eng"
+    ) -> bytes:
+        """
+        Run Tesseract and return the hOCR document itself.
+
+        Tesseract writes the hOCR to its stdout, so nothing touches the
+        filesystem. Use this when the hOCR is consumed in memory; use
+        recognize_to_hocr() when it should be kept on disk.
+
+        Args:
+            image: PIL Image to OCR
+            language: Tesseract language code (default: 'eng')
+
+        Returns:
+            hOCR document as UTF-8 bytes
+
+        Raises:
+            RuntimeError: If OCR fails
+        """
+        return self._recognize_bytes(image, language)
+
+    def recognize_many(
+        self,
+        images: List[Image.Image],
+        language: str = "eng",
+        output_paths: Optional[List[Path]] = None,
+        max_workers: Optional[int] = None,
+        batch: bool = False
+    ) -> List[Path]:
+        """
+        Run OCR on several images concurrently, one Tesseract process per page.
+
+        Each child process is pinned to omp_thread_limit threads (default 1)
+        and throughput comes from running pages side by side instead. The
+        work happens in the Tesseract child processes, so a thread pool is
+        enough to keep them all busy. Pipeline callers should use this
+        instead of looping over recognize_to_hocr().
+
+        With batch=True the pages are instead split into one contiguous shard
+        per worker and each shard goes through recognize_batch_to_hocr(), so
+        every worker starts Tesseract and loads the model once for its whole
+        shard rather than once per page.
+
+        Args:
+            images: PIL Images to OCR, in page order
+            language: Tesseract language code (default: 'eng')
+            output_paths: Base paths for output, one per image (will append .hocr)
+            max_workers: Number of concurrent Tesseract processes
+                        (default: os.cpu_count())
+            batch: Run one multi-page Tesseract process per worker
+
+        Returns:
+            List of paths to generated hOCR files, in the same order as images
+
+        Raises:
+            ValueError: If output_paths does not match the number of images
+            RuntimeError: If OCR fails for any page
+        """
+        if output_paths is not None and len(output_paths) != len(images):
+            raise ValueError(
+                f"Got {len(images)} images but {len(output_paths)} output paths"
+            )
+
+        if output_paths is None:
+            # Give every page its own temp name so concurrent runs don't collide
+            output_paths = [
+                self._temp_dir / f"morphic_temp_{os.getpid()}_{i}"
+                for i in range(len(images))
+            ]
+
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(images)))
+
+        if debug_enabled():
+            Print("DEBUG", f"Running OCR on {len(images)} images with {workers} workers"
+                           f"{' (batched)' if batch else ''}")
+
+        if batch:
+            # Contiguous shards keep page order when the results are joined
+            bounds = [len(images) * k // workers for k in range(workers + 1)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                shards = executor.map(
+                    lambda start, end: self.recognize_batch_to_hocr(
+                        images[start:end], language, output_paths[start:end]
+                    ),
+                    bounds[:-1],
+                    bounds[1:]
+                )
+                return [path for shard in shards for path in shard]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda image, path: self._recognize(image, language, path),
+                images,
+                output_paths
+            ))
+
+    def _recognize(
+        self,
+        image: Image.Image,
+        language: str,
+        output_path: Optional[Path]
+    ) -> Path:
+        """
+        Run OCR on one image and write the hOCR next to output_path.
+
+        Args:
+            image: PIL Image to OCR
+            language: Tesseract language code
+            output_path: Base path for output (will append .hocr)
+
+        Returns:
+            Path to generated hOCR file
+        """
+        # Determine output paths
+        if output_path:
+            hocr_path = output_path.parent / f"{output_path.stem}.hocr"
+        else:
+            hocr_path = self._temp_dir / "morphic_temp.hocr"
+
+        hocr_path.write_bytes(self._recognize_bytes(image, language))
+        return hocr_path
+
+    def _recognize_bytes(self, image: Image.Image, language: str) -> bytes:
+        """
+        Run Tesseract on one image piped through stdin, reading hOCR from stdout.
+
+        Args:
+            image: PIL Image to OCR
+            language: Tesseract language code
+
+        Returns:
+            hOCR document as bytes, in original image coordinates
+        """
+        # Use provided language or fall back to configured default
+        lang = language if language else self.language
+
+        image, bbox_scale = self._downscale_for_ocr(self._prepare_image(image))
+
+        # PNM carries no resolution, so pass it explicitly when known rather
+        # than let Tesseract estimate it from the text
+        dpi = image.info.get('dpi', (self.source_dpi,))[0] or self.source_dpi
+        dpi_args = ('--dpi', str(round(dpi))) if dpi else ()
+
+        # 'stdin' / 'stdout' make Tesseract read the image from standard input
+        # and write the hOCR document to standard output
+        cmd = [self.tesseract_path, 'stdin', 'stdout', *dpi_args, *self._cmd_args(lang)]
+
+        result = self._run_tesseract(cmd, input_bytes=_encode_pnm(image))
+        hocr = result.stdout
+
+        if not hocr:
+            if result.returncode != 0:
+                stderr_text = result.stderr.decode('utf-8', errors='replace').strip()
+                raise RuntimeError(
+                    f"Tesseract failed with exit code {result.returncode}: {stderr_text}"
+                )
+            Print("WARNING", "Tesseract produced empty hOCR output")
+            return hocr
+
+        if bbox_scale != 1.0:
+            hocr = self._rescale_hocr_bytes(hocr, bbox_scale)
+
+        if debug_enabled():
+            Print("DEBUG", f"Generated hOCR ({len(hocr)} bytes)")
+        return hocr
+
+    def recognize_batch_to_hocr(
+        self,
+        images: List[Image.Image],
+        language: str = "eng",
+        output_paths: Optional[List[Path]] = None
+    ) -> List[Path]:
+        """
+        Run Tesseract once over several images and return one hOCR path per image.
+
+        Tesseract accepts a text file listing one image path per line as its
+        input (pages are written as BMP to skip PNG compression). The LSTM
+        model and traineddata are then loaded once for the whole batch
+        instead of once per page, and a single hOCR document with one
+        ocr_page div per image is read back from stdout. That document is
+        split back into per-image hOCR files. A single image is piped through
+        stdin instead.
+
+        Adapted from ocrmypdf/_exec/tesseract.py:generate_hocr()
+        Key change: Simplified to not use ocrmypdf's subprocess wrapper.
+
+        Args:
+            images: PIL Images to OCR, in page order
+            language: Tesseract language code (default: 'eng')
+            output_paths: Base paths for output, one per image (will append .hocr)
+
+        Returns:
+            List of paths to generated hOCR files, in the same order as images
+
+        Raises:
+            ValueError: If output_paths does not match the number of images
+            RuntimeError: If OCR fails
         """
+        if not images:
+            return []
+
+        if output_paths is not None and len(output_paths) != len(images):
+            raise ValueError(
+                f"Got {len(images)} images but {len(output_paths)} output paths"
+            )
+
+        if len(images) == 1:
+            # A single page gains nothing from the list file and BMP on disk;
+            # pipe it through stdin like recognize_to_hocr()
+            return [self._recognize(images[0], language, output_paths[0] if output_paths else None)]
+
         # Use provided language or fall back to configured default
         lang = language if language else self.language
 
         # Determine output paths
-        if output_path:
-            temp_img = output_path.parent / f"{output_path.stem}_img.png"
-            hocr_base = output_path.parent / output_path.stem
+        work_dir = self._temp_dir
+        if output_paths:
+            page_bases = [p.parent / p.stem for p in output_paths]
         else:
-            # Use temp directory - /var/tmp is more reliable on macOS than /tmp
-            # (which is symlinked to /private/tmp and can cause Tesseract access issues)
-            temp_dir = Path("/var/tmp/morphic")
-            temp_dir.mkdir(exist_ok=True, parents=True)
-            temp_img = temp_dir / "morphic_temp.png"
-            hocr_base = temp_dir / "morphic_temp"
-
-        # Save image temporarily
-        # Convert to RGB if needed (Tesseract prefers RGB)
-        if image.mode in ('RGBA', 'LA', 'P'):
-            Print("DEBUG", f"Converting image from {image.mode} to RGB")
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            if 'A' in image.mode:
-                background.paste(image, mask=image.split()[-1])
-            else:
-                background.paste(image)
-            image = background
-
-        image.save(temp_img, format='PNG')
-        Print("DEBUG", f"Saved temp image to {temp_img}")
-
-        # Build Tesseract command
-        # Pattern from ocrmypdf/_exec/tesseract.py:generate_hocr() line ~220
-        cmd = [
-            self.tesseract_path,
-            str(temp_img),
-            str(hocr_base),
-            '-l', lang,
-            '--oem', str(self.oem),
-            '--psm', str(self.psm),
-            'hocr'  # Output format
-        ]
+            page_bases = [work_dir / f"morphic_temp_{i}" for i in range(len(images))]
+
+        hocr_paths = [base.with_suffix('.hocr') for base in page_bases]
+        bbox_scales = []
+
+        # Page images and the file list are scratch files in a private
+        # directory that is removed on exit, even if OCR fails; only the
+        # per-page hOCR lands next to the requested output paths
+        with tempfile.TemporaryDirectory(prefix='batch_', dir=work_dir) as scratch:
+            scratch = Path(scratch)
+            temp_imgs = [scratch / f"page_{i}.bmp" for i in range(len(images))]
+            list_path = scratch / "images.txt"
+
+            # Save images temporarily and list them for Tesseract
+            for image, temp_img in zip(images, temp_imgs):
+                image, bbox_scale = self._downscale_for_ocr(self._prepare_image(image))
+                bbox_scales.append(bbox_scale)
+                # Pillow stamps 96 DPI on BMPs saved without one; record the
+                # real resolution, or 0 (unknown) so Tesseract estimates it
+                # as it does for piped images without --dpi
+                dpi = image.info.get('dpi', (self.source_dpi,))[0] or self.source_dpi or 0
+                image.save(temp_img, format='BMP', dpi=(dpi, dpi))
+                if debug_enabled():
+                    Print("DEBUG", f"Saved temp image to {temp_img}")
+
+            list_path.write_text(
+                ''.join(f"{temp_img.resolve()}\n" for temp_img in temp_imgs),
+                encoding='utf-8'
+            )
 
-        Print("DEBUG", f"Running: {' '.join(cmd)}")
+            # Build Tesseract command
+            # Pattern from ocrmypdf/_exec/tesseract.py:generate_hocr() line ~220
+            # An input path ending in .txt is read as a list of images; the
+            # combined hOCR comes back on stdout and never touches disk
+            cmd = [self.tesseract_path, str(list_path), 'stdout', *self._cmd_args(lang)]
 
-        try:
-            # Use bytes mode to avoid encoding issues with Tesseract output
-            # Note: Do NOT use check=True - Tesseract may return non-zero even on success
-            # (e.g., warnings about image format that don't prevent OCR)
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=120  # 2 minute timeout for OCR
+            result = self._run_tesseract(cmd)
+
+        # Verify hOCR output was produced
+        if not result.stdout:
+            raise RuntimeError(
+                f"Tesseract produced no hOCR for a batch of {len(images)} images "
+                f"(exit code {result.returncode})"
             )
 
-            # Log Tesseract output if present (decode with error handling)
-            # Note: Tesseract writes progress/warnings to stderr even on success
-            if result.stdout:
-                stdout_text = result.stdout.decode('utf-8', errors='replace').strip()
-                if stdout_text:
-                    Print("DEBUG", f"Tesseract stdout: {stdout_text}")
-            if result.stderr:
-                stderr_text = result.stderr.decode('utf-8', errors='replace').strip()
-                # Filter out common informational messages and Leptonica noise
-                for line in stderr_text.split('\n'):
-                    # Skip version info and Leptonica errors (often spurious)
-                    if line and not line.startswith('Tesseract Open Source'):
-                        if 'Leptonica Error' not in line and 'fopenReadStream' not in line:
-                            Print("DEBUG", f"Tesseract: {line}")
+        self._split_hocr_pages(result.stdout, hocr_paths)
+
+        for hocr_path, bbox_scale in zip(hocr_paths, bbox_scales):
+            if bbox_scale != 1.0:
+                self._rescale_hocr(hocr_path, bbox_scale)
+            self._check_hocr(hocr_path)
+
+        return hocr_paths
 
+    def _cmd_args(self, language: str) -> Tuple[str, ...]:
+        """Tesseract arguments following the input and output base for language."""
+        if language == self.language:
+            return self._cmd_tail
+        return ('-l', language) + self._cmd_tail[2:]
+
+    def _prepare_image(self, image: Image.Image) -> Image.Image:
+        """
+        Flatten transparency and reduce the image to grayscale for Tesseract.
+
+        Tesseract's LSTM recognizer works on grayscale, so sending 'L' moves
+        one byte per pixel through the encoder, pipe and Leptonica loader
+        instead of three. Color is only needed for the compressed page image.
+        With grayscale disabled, color pages are flattened to RGB instead.
+        """
+        target_mode = 'L' if self.grayscale else 'RGB'
+
+        if image.mode == 'P' and 'transparency' in image.info:
+            # Only transparent palettes need the RGBA round trip; opaque ones
+            # go straight to 'L' through a single palette lookup below
+            image = image.convert('RGBA')
+
+        if image.mode in ('RGBA', 'LA') and image.getextrema()[-1][0] == 255:
+            # Fully opaque (rendered without transparency): nothing to composite
+            image = image.convert('L' if image.mode == 'LA' else target_mode)
+        elif image.mode == 'LA':
+            if debug_enabled():
+                Print("DEBUG", "Flattening LA image onto white")
+            # Already gray: blend the luma band over white using alpha as the
+            # mask, one byte per pixel instead of expanding to RGBA
+            flattened = Image.composite(
+                image.getchannel('L'),
+                Image.new('L', image.size, 255),
+                image.getchannel('A')
+            )
+            # As for RGBA below, the composite has empty info; keep the DPI
+            if 'dpi' in image.info:
+                flattened.info['dpi'] = image.info['dpi']
+            image = flattened
+        elif image.mode == 'RGBA':
+            if debug_enabled():
+                Print("DEBUG", "Flattening RGBA image onto white")
+            # alpha_composite is a single C pass; no split() band copies
+            background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+            flattened = Image.alpha_composite(background, image)
+            # The composite comes back with empty info; keep the DPI that
+            # OCR downscaling and --dpi depend on
+            if 'dpi' in image.info:
+                flattened.info['dpi'] = image.info['dpi']
+            image = flattened
+
+        if image.mode not in ('L', target_mode):
+            image = image.convert(target_mode)
+
+        return image
+
+    def _downscale_for_ocr(self, image: Image.Image) -> Tuple[Image.Image, float]:
+        """
+        Downscale an image to the configured OCR DPI and pixel budget.
+
+        OCR runtime grows with pixel count while accuracy barely improves
+        above ~300 DPI, so halving the linear resolution of a 600 DPI page
+        gives roughly 4x fewer pixels to recognize. Pages still above
+        max_megapixels would likely run into the OCR timeout; they are
+        shrunk further when auto_downscale is on (hOCR boxes lose precision
+        in proportion) and rejected up front otherwise.
+
+        Args:
+            image: Image as it will be sent to Tesseract
+
+        Returns:
+            Tuple of (image to OCR, factor mapping hOCR coordinates back to
+            the original image; 1.0 if the image was not resized)
+
+        Raises:
+            ValueError: If the image exceeds max_megapixels and
+                        auto_downscale is disabled
+        """
+        # Prefer the DPI recorded in the image, then the configured source DPI
+        source_dpi = image.info.get('dpi', (self.source_dpi,))[0] or self.source_dpi
+
+        scale = 1.0
+        if self.ocr_dpi and source_dpi and source_dpi > self.ocr_dpi:
+            scale = self.ocr_dpi / source_dpi
+
+        if self.max_megapixels:
+            megapixels = image.width * image.height * scale * scale / 1e6
+            if megapixels > self.max_megapixels:
+                if not self.auto_downscale:
+                    raise ValueError(
+                        f"Image of {image.width}x{image.height} px is {megapixels:.1f} MP "
+                        f"at OCR resolution, above max_megapixels={self.max_megapixels}. "
+                        f"Enable auto_downscale or raise the limit."
+                    )
+                scale *= (self.max_megapixels / megapixels) ** 0.5
+
+        if scale == 1.0:
+            return image, 1.0
+
+        new_size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        if debug_enabled():
+            Print("DEBUG", f"Downscaling for OCR: {image.width}x{image.height} -> "
+                           f"{new_size[0]}x{new_size[1]} px (source {source_dpi} DPI)")
+
+        resized = image.resize(new_size, Image.LANCZOS)
+        # resize() copies info, so the source DPI would otherwise carry over
+        if source_dpi:
+            resized.info['dpi'] = (source_dpi * scale, source_dpi * scale)
+        else:
+            resized.info.pop('dpi', None)
+        return resized, image.width / new_size[0]
+
+    def _rescale_hocr(self, hocr_path: Path, factor: float) -> None:
+        """
+        Multiply every hOCR bbox in a file by factor.
+
+        Only bbox properties are rescaled; they are all the PDF engine and
+        dehyphenator use for positioning.
+
+        Args:
+            hocr_path: hOCR file to rewrite in place
+            factor: Ratio of original to OCR resolution
+        """
+        hocr_path.write_bytes(self._rescale_hocr_bytes(hocr_path.read_bytes(), factor))
+
+    def _rescale_hocr_bytes(self, hocr: bytes, factor: float) -> bytes:
+        """Multiply every hOCR bbox in an in-memory document by factor."""
+        def scale(match):
+            return b'bbox ' + b' '.join(
+                b'%d' % round(int(value) * factor) for value in match.groups()
+            )
+
+        return _BBOX_RE.sub(scale, hocr)
+
+    def _check_hocr(self, hocr_path: Path) -> None:
+        """Warn if Tesseract produced an empty hOCR file."""
+        hocr_size = hocr_path.stat().st_size
+        if hocr_size == 0:
+            Print("WARNING", f"Tesseract produced empty hOCR file: {hocr_path}")
+        elif debug_enabled():
+            Print("DEBUG", f"Generated hOCR: {hocr_path} ({hocr_size} bytes)")
+
+    def _run_tesseract(
+        self,
+        cmd: List[str],
+        input_bytes: Optional[bytes] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a Tesseract OCR command and log its output.
+
+        Args:
+            cmd: Full Tesseract command line
+            input_bytes: Image data to pipe to stdin (when input is 'stdin')
+
+        Returns:
+            Completed process; stdout holds the hOCR when the output base is 'stdout'
+
+        Raises:
+            RuntimeError: If Tesseract times out
+        """
+        if debug_enabled():
+            Print("DEBUG", f"Running: {' '.join(cmd)}")
+
+        # With 'stdout' as output base, stdout is the hOCR itself; otherwise it
+        # only carries the banner, so don't buffer it at all
+        hocr_on_stdout = cmd[2] == 'stdout'
+
+        # Use bytes mode to avoid encoding issues with Tesseract output
+        # Note: Do NOT check the return code here - Tesseract may return non-zero
+        # even on success (e.g., warnings about image format that don't prevent OCR)
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input_bytes is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE if hocr_on_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=self._env,
+            close_fds=_CLOSE_FDS
+        )
+        try:
+            stdout, stderr = proc.communicate(input=input_bytes, timeout=120)  # 2 minute timeout for OCR
         except subprocess.TimeoutExpired:
+            # Reap the child and close its pipes before giving up
+            proc.kill()
+            proc.communicate()
             Print("FAILURE", "Tesseract timed out after 120 seconds")
+            raise RuntimeError("OCR timed out - image may be too large or complex")
 
-            # Cleanup temp image on timeout
-            if temp_img.exists():
-                temp_img.unlink()
+        result = subprocess.CompletedProcess(cmd, proc.returncode, stdout or b'', stderr)
 
-            raise RuntimeError("OCR timed out - image may be too large or complex")
+        # Log Tesseract output if present (decode with error handling)
+        # Note: Tesseract writes progress/warnings to stderr even on success
+        if result.stderr and debug_enabled():
+            _print = Print  # local binding for the per-line loop
+            skip = _STDERR_SKIP_RE.search
+            # Leptonica can be chatty on odd inputs; only log the head. Lines
+            # are filtered as bytes so skipped ones are never decoded.
+            for line in result.stderr[:_STDERR_LOG_LIMIT].split(b'\n'):
+                line = line.strip()
+                if line and not skip(line):
+                    _print("DEBUG", f"Tesseract: {line.decode('utf-8', errors='replace')}")
+
+        return result
+
+    def _split_hocr_pages(self, batch_hocr: bytes, hocr_paths: List[Path]) -> None:
+        """
+        Split a multi-page hOCR document into one file per ocr_page div.
+
+        Each output file keeps the original html/head/body skeleton so it
+        parses exactly like a single-image Tesseract run.
 
-        # Verify hOCR output was created
-        hocr_path = hocr_base.with_suffix('.hocr')
+        Args:
+            batch_hocr: hOCR document produced from an image list
+            hocr_paths: Destination paths, one per expected page
 
-        if not hocr_path.exists():
-            # Cleanup temp image
-            if temp_img.exists():
-                temp_img.unlink()
+        Raises:
+            RuntimeError: If the page count does not match
+        """
+        tree = etree.fromstring(batch_hocr).getroottree()
+        pages = _PAGE_XPATH(tree)
 
+        if len(pages) != len(hocr_paths):
             raise RuntimeError(
-                f"Tesseract did not produce expected output: {hocr_path}"
+                f"Expected {len(hocr_paths)} pages in batch hOCR, found {len(pages)}"
             )
 
-        # Verify hOCR has content
-        if hocr_path.stat().st_size == 0:
-            Print("WARNING", "Tesseract produced empty hOCR file")
-        else:
-            Print("DEBUG", f"Generated hOCR: {hocr_path} ({hocr_path.stat().st_size} bytes)")
-
-        # Cleanup temp image
-        if temp_img.exists():
-            temp_img.unlink()
+        body = pages[0].getparent()
+        for page in pages:
+            body.remove(page)
 
-        return hocr_path
+        for page, hocr_path in zip(pages, hocr_paths):
+            body.append(page)
+            tree.write(str(hocr_path), encoding='utf-8', xml_declaration=True)
+            body.remove(page)
 
     @property
     def name(self) -> str:
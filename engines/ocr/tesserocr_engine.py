@@ -0,0 +1,262 @@
+"""
+In-process Tesseract OCR engine for Morphic v0.2 (tesserocr binding)
+
+The subprocess engine pays for fork/exec plus a full LSTM model and
+traineddata load on every page. tesserocr wraps Tesseract's C++ API, so the
+model is loaded once when the engine is initialized and pages are handed
+over as PIL images - no image encoding, no pipe, no process start.
+
+Everything around the recognizer (grayscale preparation, OCR downscaling,
+hOCR bbox rescaling) is shared with TesseractEngine. If tesserocr is not
+installed the engine falls back to the tesseract CLI.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional
+from PIL import Image
+from . import register_ocr_engine
+from .tesseract import TesseractEngine
+from utilities import Print
+
+# Try to import tesserocr for in-process recognition
+try:
+    import tesserocr
+    from tesserocr import PyTessBaseAPI
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+
+# GetHOCRText() returns only the ocr_page div; wrap it in the same XHTML
+# document the tesseract CLI hOCR renderer writes so downstream parsers
+# see identical input from both engines.
+_HOCR_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n'
+    ' <head>\n'
+    '  <title></title>\n'
+    '  <meta http-equiv="Content-Type" content="text/html;charset=utf-8"/>\n'
+    "  <meta name='ocr-system' content='tesseract {version}' />\n"
+    "  <meta name='ocr-capabilities' content='ocr_page ocr_carea ocr_par ocr_line ocrx_word ocrp_wconf'/>\n"
+    ' </head>\n'
+    ' <body>\n'
+)
+_HOCR_FOOTER = ' </body>\n</html>\n'
+
+
+@register_ocr_engine("tesserocr")
+class TesserocrEngineFactory:
+    """Factory for creating in-process Tesseract engine instances."""
+
+    @staticmethod
+    def create(config: dict):
+        """
+        Create a tesserocr engine instance.
+
+        Args:
+            config: Configuration dictionary with:
+                - tessdata_dir: Directory containing traineddata files
+                               (default: Tesseract's built-in location)
+                - oem, psm, language, ocr_dpi, source_dpi, omp_thread_limit:
+                  as for 'tesseract' (omp_thread_limit is applied by the
+                  pipeline before tesserocr is loaded)
+                - binary_path: tesseract binary used if tesserocr is missing
+
+        Returns:
+            TesserocrEngine instance
+        """
+        return TesserocrEngine(config)
+
+
+class TesserocrEngine(TesseractEngine):
+    """
+    Tesseract OCR through the tesserocr C API binding.
+
+    Each thread that recognizes pages gets its own PyTessBaseAPI, which
+    holds the loaded model for the lifetime of the engine. The API object is
+    not thread-safe, so instances are never shared between threads; pages
+    run through recognize_many therefore cost one model load per worker.
+    """
+
+    def __init__(self, config: dict):
+        """
+        Initialize tesserocr engine.
+
+        Args:
+            config: Configuration dictionary
+        """
+        super().__init__(config)
+        self.tessdata_dir = config.get('tessdata_dir')
+        # API opened by initialize(); None means the CLI fallback is in use
+        self._api = None
+        # Per-thread (api, language) and every API opened, for close()
+        self._local = threading.local()
+        self._apis: List['PyTessBaseAPI'] = []
+        self._apis_lock = threading.Lock()
+
+    def initialize(self, config: dict) -> None:
+        """
+        Load the Tesseract model, or fall back to the CLI without tesserocr.
+
+        Args:
+            config: Additional configuration (currently unused)
+
+        Raises:
+            RuntimeError: If the model cannot be loaded or the language is missing
+        """
+        if not TESSEROCR_AVAILABLE:
+            Print("WARNING", "tesserocr not installed, falling back to the tesseract CLI. "
+                             "Install with: pip install tesserocr")
+            super().initialize(config)
+            return
+
+        try:
+            self._api = self._thread_api(self.language)
+        except RuntimeError as e:
+            raise RuntimeError(f"tesserocr initialization failed: {e}")
+
+        self._version = f"tesseract {tesserocr.tesseract_version().split()[1]}"
+        Print("SUCCESS", f"Loaded {self._version} in-process via tesserocr")
+
+        self._verify_language(self.language, self._api.GetAvailableLanguages())
+
+    def _open_api(self, language: str) -> 'PyTessBaseAPI':
+        """
+        Create a PyTessBaseAPI with the model for language loaded.
+
+        Raises:
+            RuntimeError: If Tesseract cannot load the traineddata
+        """
+        # OEM/PSM are constant namespaces, not enums: pass the plain ints
+        kwargs = {
+            'lang': language,
+            'oem': self.oem,
+            'psm': self.psm,
+        }
+        if self.tessdata_dir:
+            kwargs['path'] = str(self.tessdata_dir)
+
+        api = PyTessBaseAPI(**kwargs)
+        with self._apis_lock:
+            self._apis.append(api)
+        return api
+
+    def _thread_api(self, language: str) -> 'PyTessBaseAPI':
+        """
+        Return the calling thread's API, loading the model on first use.
+
+        Raises:
+            RuntimeError: If Tesseract cannot load the traineddata
+        """
+        api = getattr(self._local, 'api', None)
+        if api is not None and self._local.language == language:
+            return api
+
+        if api is not None:
+            # Loading a different model is as slow as a CLI cold start;
+            # keep it for the rest of the run
+            with self._apis_lock:
+                self._apis.remove(api)
+            api.End()
+
+        api = self._open_api(language)
+        self._local.api = api
+        self._local.language = language
+        return api
+
+    def close(self) -> None:
+        """Release the Tesseract models loaded by every thread."""
+        with self._apis_lock:
+            apis, self._apis = self._apis, []
+            self._api = None
+            # Drop every thread's reference to the APIs ended below
+            self._local = threading.local()
+        for api in apis:
+            api.End()
+
+    def __del__(self):
+        # Interpreter shutdown may have torn down the binding already
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _recognize_bytes(self, image: Image.Image, language: str) -> bytes:
+        """
+        Run in-process OCR on one image.
+
+        Args:
+            image: PIL Image to OCR
+            language: Tesseract language code
+
+        Returns:
+            hOCR document as UTF-8 bytes, in original image coordinates
+        """
+        if self._api is None:
+            return super()._recognize_bytes(image, language)
+
+        lang = language if language else self.language
+
+        image, bbox_scale = self._downscale_for_ocr(self._prepare_image(image))
+
+        api = self._thread_api(lang)
+        api.SetImage(image)
+        page_hocr = api.GetHOCRText(0)
+
+        hocr = (
+            _HOCR_HEADER.format(version=self._version.split()[-1]) + page_hocr + _HOCR_FOOTER
+        ).encode('utf-8')
+
+        if bbox_scale != 1.0:
+            hocr = self._rescale_hocr_bytes(hocr, bbox_scale)
+
+        return hocr
+
+    def recognize_batch_to_hocr(
+        self,
+        images: List[Image.Image],
+        language: str = "eng",
+        output_paths: Optional[List[Path]] = None
+    ) -> List[Path]:
+        """
+        Run OCR on several images with the already loaded model.
+
+        The CLI batch mode exists to load the model once per batch; with the
+        model resident in this process, pages are simply recognized in order.
+
+        Args:
+            images: PIL Images to OCR, in page order
+            language: Tesseract language code (default: 'eng')
+            output_paths: Base paths for output, one per image (will append .hocr)
+
+        Returns:
+            List of paths to generated hOCR files, in the same order as images
+
+        Raises:
+            ValueError: If output_paths does not match the number of images
+        """
+        if self._api is None:
+            return super().recognize_batch_to_hocr(images, language, output_paths)
+
+        if output_paths is not None and len(output_paths) != len(images):
+            raise ValueError(
+                f"Got {len(images)} images but {len(output_paths)} output paths"
+            )
+
+        if output_paths is None:
+            output_paths = [
+                self._temp_dir / f"morphic_temp_{os.getpid()}_{i}"
+                for i in range(len(images))
+            ]
+
+        return [
+            self._recognize(image, language, path)
+            for image, path in zip(images, output_paths)
+        ]
+
+    @property
+    def name(self) -> str:
+        """Engine identifier."""
+        return "tesserocr" if self._api is not None else "tesserocr (CLI fallback)"
@@ -15,12 +15,31 @@ Usage:
     engine = get_pdf_engine("pikepdf", config)
 """
 
-from typing import Dict, Callable
+import importlib
+from types import MappingProxyType
+from typing import Dict, Callable, Mapping, Set
 from .base import PDFEngine
 
 # Global registry of PDF engine factories
 PDF_REGISTRY: Dict[str, Callable[[dict], PDFEngine]] = {}
 
+# Modules providing the built-in engines, keyed by registered name. They are
+# imported on first lookup rather than with this package, so pikepdf (and
+# qpdf behind it) is only loaded by processes that build PDFs.
+_BUILTIN_MODULES: Dict[str, str] = {
+    'pikepdf': 'pikepdf_engine',
+}
+
+# Built-in modules whose import has already been attempted
+_IMPORTED: Set[str] = set()
+
+# ImportError raised by each built-in module that failed to import, re-raised
+# when one of its names is requested
+_IMPORT_ERRORS: Dict[str, ImportError] = {}
+
+# Read-only live view of the registry for callers that only need to look
+PDF_REGISTRY_VIEW: Mapping[str, Callable[[dict], PDFEngine]] = MappingProxyType(PDF_REGISTRY)
+
 
 def register_pdf_engine(name: str):
     """
@@ -32,6 +51,9 @@ def register_pdf_engine(name: str):
     Returns:
         Decorator function that registers the factory class
 
+    Raises:
+        TypeError: If the factory class has no callable create()
+
     Example:
         @register_pdf_engine("pikepdf")
         class PikePDFEngineFactory:
@@ -40,11 +62,61 @@ def register_pdf_engine(name: str):
                 return PikePDFEngine(config)
     """
     def decorator(factory_class):
-        PDF_REGISTRY[name] = factory_class.create
+        # Checked once at import time rather than on every create() call
+        create = getattr(factory_class, 'create', None)
+        if not callable(create):
+            raise TypeError(
+                f"PDF engine factory '{name}' ({factory_class.__name__}) "
+                f"must define a callable create(config)"
+            )
+        PDF_REGISTRY[name] = create
         return factory_class
     return decorator
 
 
+def _import_builtin(name: str) -> None:
+    """Import the built-in module that registers name, once per process."""
+    module = _BUILTIN_MODULES.get(name)
+    if module is None or module in _IMPORTED:
+        return
+    _IMPORTED.add(module)
+    try:
+        importlib.import_module(f'.{module}', __package__)
+    except ImportError as e:
+        # Dependencies for this engine are not installed
+        _IMPORT_ERRORS[module] = e
+
+
+def _raise_unregistered(name: str) -> None:
+    """
+    Raise the error for a PDF engine name that did not register.
+
+    Raises:
+        ImportError: If name is built in but its module failed to import
+                     (chained to the original ImportError)
+        ValueError: If name is not known at all
+    """
+    error = _IMPORT_ERRORS.get(_BUILTIN_MODULES.get(name))
+    if error is not None:
+        raise ImportError(f"PDF engine '{name}' is unavailable: {error}") from error
+
+    # Offer only names that actually registered
+    for builtin in _BUILTIN_MODULES:
+        _import_builtin(builtin)
+    raise ValueError(
+        f"Unknown PDF engine: '{name}'. "
+        f"Available engines: {', '.join(PDF_REGISTRY) or 'none'}"
+    )
+
+
+def __getattr__(name: str):
+    # Keep 'engines.pdf.pikepdf_engine' attribute access working without
+    # importing the engine modules up front
+    if name in _BUILTIN_MODULES.values():
+        return importlib.import_module(f'.{name}', __package__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_pdf_engine(name: str, config: dict) -> PDFEngine:
     """
     Get a PDF engine instance by name.
@@ -58,19 +130,13 @@ def get_pdf_engine(name: str, config: dict) -> PDFEngine:
 
     Raises:
         ValueError: If engine name is not registered
+        ImportError: If the built-in PDF engine's dependencies are not installed
     """
-    if name not in PDF_REGISTRY:
-        available = ', '.join(PDF_REGISTRY.keys()) if PDF_REGISTRY else 'none'
-        raise ValueError(
-            f"Unknown PDF engine: '{name}'. "
-            f"Available engines: {available}"
-        )
-    return PDF_REGISTRY[name](config)
-
-
-# Auto-import available engines to trigger registration
-try:
-    from . import pikepdf_engine  # noqa: F401
-except ImportError:
-    # Engine not yet implemented
-    pass
+    factory = PDF_REGISTRY.get(name)
+    if factory is None:
+        _import_builtin(name)
+        factory = PDF_REGISTRY.get(name)
+    if factory is None:
+        _raise_unregistered(name)
+    return factory(config)
+
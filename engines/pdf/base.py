@@ -4,9 +4,13 @@ PDF Engine Protocol for Morphic v0.2
 Defines the contract that all PDF manipulation engines must implement.
 """
 
-from typing import Protocol, List
+from typing import TYPE_CHECKING, Protocol, List, Optional, Union
 from pathlib import Path
-import pikepdf
+
+if TYPE_CHECKING:
+    # Annotations only; engines import pikepdf themselves when loaded
+    import pikepdf
+    from PIL import Image
 
 
 class PDFEngine(Protocol):
@@ -17,15 +21,20 @@ class PDFEngine(Protocol):
     - Creating searchable PDF pages from images + hOCR
     - Embedding invisible text layers (rendering mode 3)
     - Merging multiple pages into final document
+
+    This is a static Protocol for type checkers only; it is deliberately not
+    runtime_checkable, so isinstance() checks against it are not supported.
+    register_pdf_engine checks factories once, when they are registered.
     """
 
     def create_searchable_page(
         self,
         image_path: Path,
-        hocr_path: Path,
+        hocr_path: Union[Path, bytes],
         dpi: int,
-        compressor
-    ) -> pikepdf.Pdf:
+        compressor,
+        pdf: Optional['pikepdf.Pdf'] = None
+    ) -> 'pikepdf.Pdf':
         """
         Create a PDF page with invisible text layer.
 
@@ -36,19 +45,78 @@ class PDFEngine(Protocol):
 
         Args:
             image_path: Path to image file for this page
-            hocr_path: Path to hOCR file with OCR results
+            hocr_path: Path to hOCR file with OCR results, or the hOCR
+                       document as bytes (skips a write and re-read)
             dpi: DPI of the source image (for coordinate conversion)
             compressor: ImageCompressor instance for image encoding
+            pdf: Existing document to append the page to; when omitted a
+                 new single-page PDF is created
 
         Returns:
-            Single-page PDF with image and text layer
+            The PDF the page (image and text layer) was added to
 
         Raises:
             RuntimeError: If PDF creation fails
         """
         ...
 
-    def merge_pages(self, pages: List[pikepdf.Pdf]) -> pikepdf.Pdf:
+    def prepare_page(
+        self,
+        image_path: Path,
+        hocr_path: Union[Path, bytes],
+        dpi: int,
+        compressor,
+        image: Optional['Image.Image'] = None
+    ):
+        """
+        Do the CPU-bound work of create_searchable_page() without a PDF.
+
+        The result is picklable, so pages can be prepared in worker
+        processes and added in order with add_prepared_page().
+
+        Args:
+            image_path, hocr_path, dpi, compressor: As for create_searchable_page
+            image: The image at image_path if the caller already has it open
+
+        Returns:
+            Engine-specific prepared page
+        """
+        ...
+
+    def add_prepared_page(
+        self,
+        prepared,
+        compressor,
+        pdf: Optional['pikepdf.Pdf'] = None
+    ) -> 'pikepdf.Pdf':
+        """
+        Add a page from prepare_page() to a document.
+
+        Args:
+            prepared: Output of prepare_page()
+            compressor: Compressor the image was encoded with
+            pdf: Document to append to; when omitted a new PDF is created
+
+        Returns:
+            The PDF the page was added to
+        """
+        ...
+
+    def open_output(self, output_path: Path):
+        """
+        Open a document that pages are appended to as they are produced.
+
+        Args:
+            output_path: Where the finished PDF is written
+
+        Returns:
+            Context manager with add_page(image_path, hocr_path, dpi,
+            compressor) and add_prepared_page(prepared, compressor); the
+            PDF is saved when the block exits cleanly
+        """
+        ...
+
+    def merge_pages(self, pages: List['pikepdf.Pdf']) -> 'pikepdf.Pdf':
         """
         Merge multiple PDF pages into one document.
 
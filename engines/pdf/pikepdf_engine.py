@@ -24,11 +24,18 @@ Original authors: James R. Barlow and contributors
 License: MIT/MPL-2.0
 """
 
+import functools
+import os
+from contextlib import nullcontext
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+import numpy as np
 import pikepdf
 from lxml import etree
 from PIL import Image
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 
 from . import register_pdf_engine
@@ -38,12 +45,60 @@ import sys
 repo_root = Path(__file__).resolve().parent.parent.parent
 if str(repo_root) not in sys.path:
     sys.path.insert(0, str(repo_root))
-from utilities import Print
-
-
-@dataclass
+from utilities import Print, debug_enabled
+
+# Characters escaped inside PDF string literals, applied in one translate()
+# pass instead of a chain of replace() calls
+_PDF_ESCAPE_TABLE = str.maketrans({
+    '\\': '\\\\',
+    '(': '\\(',
+    ')': '\\)',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
+# Text that needed Unicode normalization only has the delimiters escaped
+_PDF_DELIMITER_ESCAPE_TABLE = str.maketrans({
+    '\\': '\\\\',
+    '(': '\\(',
+    ')': '\\)',
+})
+
+# Common Unicode punctuation and ligatures with plain ASCII equivalents
+_UNICODE_TO_ASCII = str.maketrans({
+    '\u2018': "'",   # Left single quote
+    '\u2019': "'",   # Right single quote
+    '\u201c': '"',   # Left double quote
+    '\u201d': '"',   # Right double quote
+    '\u2013': '-',   # En dash
+    '\u2014': '-',   # Em dash
+    '\u2026': '...', # Ellipsis
+    '\u00a0': ' ',   # Non-breaking space
+    '\ufb01': 'fi',  # fi ligature
+    '\ufb02': 'fl',  # fl ligature
+})
+
+# hOCR parsers built once, with entity expansion and (for HTML) the ID table
+# switched off and no size limit for very dense pages. Blank text is kept,
+# as word elements may have tails. The XML parser keeps collecting IDs:
+# without that libxml2 tries to fetch the XHTML DTD Tesseract declares.
+_HOCR_PARSER = etree.XMLParser(resolve_entities=False, huge_tree=True)
+_HOCR_HTML_PARSER = etree.HTMLParser(recover=True, collect_ids=False, huge_tree=True)
+
+# Leading "bbox x1 y1 x2 y2" property of an hOCR title attribute
+_BBOX_RE = re.compile(r'\s*bbox\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)(?![^\s;])')
+
+
+@functools.lru_cache(maxsize=None)
+def _filter_name(filter_name: str) -> pikepdf.Name:
+    """PDF name object for a compressor's filter (e.g. 'JPXDecode')."""
+    return pikepdf.Name(f'/{filter_name}')
+
+
+@dataclass(slots=True)
 class BoundingBox:
-    """Represents a bounding box from hOCR."""
+    """Represents a bounding box from hOCR (one per element, so no __dict__)."""
     x1: int
     y1: int
     x2: int
@@ -58,6 +113,17 @@ class BoundingBox:
         return self.y2 - self.y1
 
 
+@dataclass(slots=True)
+class PreparedPage:
+    """Everything needed to add one page, computed without touching a Pdf."""
+    image_bytes: bytes
+    content_stream: bytes
+    width_px: int
+    height_px: int
+    width_pt: float
+    height_pt: float
+
+
 @register_pdf_engine("pikepdf")
 class PikePDFEngineFactory:
     """Factory for creating pikepdf engine instances."""
@@ -103,6 +169,12 @@ class PikePDFEngine:
                 - rendering_mode: int - PDF text rendering mode (default: 3)
                 - font: str - Font name or font type key (default: 'Helvetica')
                 - font_size_ratio: float - Bbox height multiplier (default: 0.75)
+                - flush_every: int - Pages between flushes to disk in
+                               open_output() (default: 0, never)
+                - object_streams: bool - Pack objects into compressed object
+                                  streams on the final save (default: True)
+                - linearize: bool - Write a linearized ("fast web view") PDF
+                             (default: True)
         """
         self.rendering_mode = config.get('rendering_mode', 3)
 
@@ -117,14 +189,28 @@ class PikePDFEngine:
         # 0.75 works well for most OCR output - prevents overflow
         self.font_size_ratio = config.get('font_size_ratio', 0.75)
 
+        # A Pdf keeps every page's compressed image in memory until saved;
+        # flushing writes them out and reopens the file lazily
+        self.flush_every = config.get('flush_every', 0)
+
+        # Output layout of the final save; object streams and an xref stream
+        # shrink the per-object overhead of many small text/font objects
+        self.object_streams = config.get('object_streams', True)
+        self.linearize = config.get('linearize', True)
+
+        # Indirect /Font resource dict (<< /F1 font >>) of the document pages
+        # are currently built into; shared by all of that document's pages
+        self._font_resources: Optional[pikepdf.Object] = None
+
         Print("DEBUG", f"PDF engine initialized: font={self.font_name}, mode={self.rendering_mode}")
 
     def create_searchable_page(
         self,
         image_path: Path,
-        hocr_path: Path,
+        hocr_path: Union[Path, bytes],
         dpi: int,
-        compressor
+        compressor,
+        pdf: Optional[pikepdf.Pdf] = None
     ) -> pikepdf.Pdf:
         """
         Create a PDF page with invisible text layer.
@@ -138,88 +224,204 @@ class PikePDFEngine:
 
         Args:
             image_path: Path to source image
-            hocr_path: Path to hOCR file with word bounding boxes
+            hocr_path: Path to hOCR file with word bounding boxes, or the
+                       hOCR document itself (e.g. from recognize_to_hocr_bytes)
             dpi: DPI of source image (for coordinate conversion)
             compressor: ImageCompressor instance for encoding
+            pdf: Document to append the page to (default: a new one). Building
+                 every page into one document skips merge_pages(), which
+                 copies each page's object graph again.
 
         Returns:
-            Single-page pikepdf.Pdf object
+            The pikepdf.Pdf the page was added to (single-page if pdf was None)
         """
-        Print("DEBUG", f"Creating searchable page from {image_path.name}")
+        prepared = self.prepare_page(image_path, hocr_path, dpi, compressor)
+        return self.add_prepared_page(prepared, compressor, pdf)
 
-        # Load and prepare image
-        img = Image.open(image_path)
-        original_mode = img.mode
+    def prepare_page(
+        self,
+        image_path: Path,
+        hocr_path: Union[Path, bytes],
+        dpi: int,
+        compressor,
+        image: Optional[Image.Image] = None
+    ) -> PreparedPage:
+        """
+        Do the CPU-bound part of building a page: compress the image, parse
+        the hOCR and generate the content stream.
 
-        if img.mode in ('RGBA', 'LA', 'P'):
-            img = self._convert_to_rgb(img)
-            Print("DEBUG", f"Converted image from {original_mode} to RGB")
+        No pikepdf state is involved, so pages can be prepared in worker
+        processes and added to the document afterwards.
 
-        width_px, height_px = img.size
+        Args:
+            image_path, hocr_path, dpi, compressor: As for create_searchable_page
+            image: image_path already opened by the caller (e.g. for OCR);
+                   saves decoding the file a second time. Not closed here.
+
+        Returns:
+            PreparedPage for add_prepared_page()
+        """
+        if debug_enabled():
+            Print("DEBUG", f"Creating searchable page from {image_path.name}")
 
-        # Compress image
-        compressed_bytes = compressor.compress(img)
-        Print("DEBUG", f"Compressed image: {len(compressed_bytes):,} bytes")
+        # Image.open only reads the header; pixels are decoded on first use,
+        # so size, mode and format are free
+        with nullcontext(image) if image is not None else Image.open(image_path) as img:
+            original_mode = img.mode
+            width_px, height_px = img.size
+
+            # Files already in the target format are embedded as they are,
+            # without ever decoding the pixels
+            compressed_bytes = None
+            if original_mode not in ('RGBA', 'LA', 'P'):
+                compressed_bytes = compressor.compress_raw(image_path, img.format, original_mode)
+
+            if compressed_bytes is None:
+                if original_mode in ('RGBA', 'LA', 'P'):
+                    img = self._convert_to_rgb(img)
+                    if debug_enabled():
+                        Print("DEBUG", f"Converted image from {original_mode} to RGB")
+
+                # Compress image
+                compressed_bytes = compressor.compress(img)
+
+        if debug_enabled():
+            Print("DEBUG", f"Compressed image: {len(compressed_bytes):,} bytes")
 
         # Calculate page size in PDF points (72 points = 1 inch)
         # PDF coordinate system: origin at bottom-left, Y increases upward
         width_pt = (width_px / dpi) * 72.0
         height_pt = (height_px / dpi) * 72.0
 
-        Print("DEBUG", f"Page size: {width_pt:.1f} x {height_pt:.1f} points ({width_px}x{height_px}px at {dpi} DPI)")
-
-        # Create new PDF
-        pdf = pikepdf.Pdf.new()
+        if debug_enabled():
+            Print("DEBUG", f"Page size: {width_pt:.1f} x {height_pt:.1f} points ({width_px}x{height_px}px at {dpi} DPI)")
 
         # Parse hOCR
         hocr_tree = self._parse_hocr(hocr_path)
 
-        # Build content stream
+        # Build content stream in one growing buffer
         # ORDER MATTERS: Text first (invisible), then image on top
-        content_parts = []
+        content_stream = bytearray()
 
         # Part 1: Invisible text layer
-        text_commands = self._build_text_layer(hocr_tree, width_pt, height_pt, dpi)
-        content_parts.extend(text_commands)
+        self._build_text_layer(content_stream, hocr_tree, width_pt, height_pt, dpi)
 
         # Part 2: Image layer (drawn ON TOP of text)
-        image_commands = self._build_image_layer(width_pt, height_pt)
-        content_parts.extend(image_commands)
+        self._build_image_layer(content_stream, width_pt, height_pt)
+
+        return PreparedPage(
+            compressed_bytes, bytes(content_stream),
+            width_px, height_px, width_pt, height_pt
+        )
 
-        # Join all commands with newlines
-        content_stream = b'\n'.join(content_parts)
+    def add_prepared_page(
+        self,
+        prepared: PreparedPage,
+        compressor,
+        pdf: Optional[pikepdf.Pdf] = None
+    ) -> pikepdf.Pdf:
+        """
+        Add a page from prepare_page() to a document.
+
+        Args:
+            prepared: Output of prepare_page()
+            compressor: Compressor the image was encoded with (for filter name)
+            pdf: Document to append the page to (default: a new one)
+
+        Returns:
+            The pikepdf.Pdf the page was added to
+        """
+        # Create new PDF, or append to the caller's document
+        if pdf is None:
+            pdf = pikepdf.Pdf.new()
 
         # Create PDF page with resources
-        page = self._create_page(
-            pdf, content_stream, compressed_bytes,
-            width_px, height_px, width_pt, height_pt,
+        self._create_page(
+            pdf, prepared.content_stream, prepared.image_bytes,
+            prepared.width_px, prepared.height_px,
+            prepared.width_pt, prepared.height_pt,
             compressor
         )
 
         return pdf
 
-    def _parse_hocr(self, hocr_path: Path) -> etree._ElementTree:
-        """Parse hOCR file into lxml tree."""
+    def create_searchable_pages(
+        self,
+        pages: List[Tuple[Path, Union[Path, bytes]]],
+        dpi: int,
+        compressor,
+        pdf: Optional[pikepdf.Pdf] = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True
+    ) -> pikepdf.Pdf:
+        """
+        Create several pages, preparing them concurrently.
+
+        Image compression, hOCR parsing and content stream generation run in
+        a process pool; only building the pikepdf object graph, which is fast
+        once the data is ready, stays serial in this process.
+
+        Args:
+            pages: (image_path, hocr_path) pairs, in page order
+            dpi: DPI of the source images
+            compressor: ImageCompressor instance for encoding (must pickle)
+            pdf: Document to append the pages to (default: a new one)
+            max_workers: Number of pages prepared at once (default: os.cpu_count())
+            use_processes: Use a ProcessPoolExecutor instead of threads
+
+        Returns:
+            The pikepdf.Pdf the pages were added to
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(pages))
+        if workers <= 1:
+            prepared = [
+                self.prepare_page(image_path, hocr_path, dpi, compressor)
+                for image_path, hocr_path in pages
+            ]
+        else:
+            executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            image_paths, hocr_paths = zip(*pages)
+            with executor_class(max_workers=workers) as executor:
+                prepared = list(executor.map(
+                    self.prepare_page, image_paths, hocr_paths,
+                    repeat(dpi), repeat(compressor)
+                ))
+
+        if pdf is None:
+            pdf = pikepdf.Pdf.new()
+        for page in prepared:
+            self.add_prepared_page(page, compressor, pdf)
+        return pdf
+
+    def _parse_hocr(self, hocr_path: Union[Path, bytes]) -> etree._ElementTree:
+        """Parse an hOCR file, or hOCR bytes already in memory, into an lxml tree."""
+        if isinstance(hocr_path, bytes):
+            def parse(parser):
+                return etree.fromstring(hocr_path, parser).getroottree()
+            source = "data"
+        else:
+            def parse(parser):
+                return etree.parse(str(hocr_path), parser)
+            source = f"file {hocr_path}"
+
         try:
             # Try XML parser first (preserves namespaces)
             try:
-                tree = etree.parse(str(hocr_path))
-                return tree
+                return parse(_HOCR_PARSER)
             except etree.XMLSyntaxError:
                 # Fall back to HTML parser for malformed documents
-                parser = etree.HTMLParser(recover=True)
-                tree = etree.parse(str(hocr_path), parser)
-                return tree
+                return parse(_HOCR_HTML_PARSER)
         except Exception as e:
-            raise RuntimeError(f"Failed to parse hOCR file {hocr_path}: {e}")
+            raise RuntimeError(f"Failed to parse hOCR {source}: {e}")
 
     def _build_text_layer(
         self,
+        buf: bytearray,
         hocr_tree: etree._ElementTree,
         page_width_pt: float,
         page_height_pt: float,
         dpi: int
-    ) -> List[bytes]:
+    ) -> None:
         """
         Build invisible text content stream from hOCR.
 
@@ -243,47 +445,52 @@ class PikePDFEngine:
         - TJ: Show text with positioning array
 
         Args:
+            buf: Content stream buffer; one newline-terminated command is
+                 appended per operator
             hocr_tree: Parsed hOCR document
             page_width_pt: Page width in PDF points
             page_height_pt: Page height in PDF points
             dpi: Source image DPI
-
-        Returns:
-            List of PDF content stream commands as bytes
         """
-        content = []
-
         # Track counts for logging
         word_count = 0
         line_count = 0
 
-        # Process hOCR hierarchically to maintain reading order
-        ns = {'x': 'http://www.w3.org/1999/xhtml'}
-
-        # Get lines (preserves reading order)
-        lines = hocr_tree.xpath('//x:span[@class="ocr_line"]', namespaces=ns)
-        if not lines:
-            lines = hocr_tree.xpath('//*[@class="ocr_line"]')
+        # Collect lines and their words in one document-order walk instead of
+        # one XPath query for the lines plus one per line for its words.
+        # Matching is on the class attribute alone, so XHTML (namespaced) and
+        # plain HTML hOCR are handled alike.
+        lines = []        # (line element, words in that line), in reading order
+        all_words = []    # every word, for documents without line structure
+        current_line = None
+        for event, element in etree.iterwalk(hocr_tree, events=('start', 'end')):
+            if event == 'start':
+                css_class = element.get('class')
+                if css_class == 'ocr_line':
+                    current_line = (element, [])
+                    lines.append(current_line)
+                elif css_class == 'ocrx_word':
+                    all_words.append(element)
+                    if current_line is not None:
+                        current_line[1].append(element)
+            elif current_line is not None and element is current_line[0]:
+                current_line = None
 
         if lines:
-            Print("DEBUG", f"Found {len(lines)} lines in hOCR, processing with TJ operator")
+            if debug_enabled():
+                Print("DEBUG", f"Found {len(lines)} lines in hOCR, processing with TJ operator")
+
+            for line, words in lines:
+                if not words:
+                    continue
 
-            for line in lines:
                 # Get line bounding box for Y positioning
                 line_bbox = self._parse_bbox(line.get('title', ''))
                 line_y_pt = page_height_pt - (line_bbox.y2 / dpi) * 72.0
 
-                # Get words within this line
-                words = line.xpath('.//x:span[@class="ocrx_word"]', namespaces=ns)
-                if not words:
-                    words = line.xpath('.//*[@class="ocrx_word"]')
-
-                if not words:
-                    continue
-
                 # Build line using TJ operator
                 line_word_count = self._build_line_with_tj(
-                    content, words, line_y_pt, page_height_pt, dpi
+                    buf, words, line_y_pt, page_height_pt, dpi
                 )
                 word_count += line_word_count
                 if line_word_count > 0:
@@ -291,39 +498,44 @@ class PikePDFEngine:
 
         else:
             # Fallback: no line structure found, group words by Y coordinate
-            Print("DEBUG", "No line structure found, falling back to coordinate grouping")
+            if debug_enabled():
+                Print("DEBUG", "No line structure found, falling back to coordinate grouping")
 
-            words = hocr_tree.xpath('//x:span[@class="ocrx_word"]', namespaces=ns)
-            if not words:
-                words = hocr_tree.xpath('//*[@class="ocrx_word"]')
+            # Parse every bbox once; sorting, grouping and line building
+            # all reuse it
+            bboxes = [self._parse_bbox(word.get('title', '')) for word in all_words]
 
             # Group words by approximate Y coordinate
             Y_TOLERANCE = 10  # pixels
 
-            def get_sort_key(word):
-                bbox = self._parse_bbox(word.get('title', ''))
-                return (bbox.y1, bbox.x1)
-
-            words = sorted(words, key=get_sort_key)
+            # Sort by (y1, x1) in one C-level pass; lexsort is stable, like sorted()
+            n = len(bboxes)
+            y1 = np.fromiter((bbox.y1 for bbox in bboxes), dtype=np.int64, count=n)
+            x1 = np.fromiter((bbox.x1 for bbox in bboxes), dtype=np.int64, count=n)
+            order = np.lexsort((x1, y1)).tolist()
 
-            # Group into lines based on Y coordinate
+            # Group into lines based on Y coordinate. Each word is compared
+            # with the line's first word, not its neighbour, so this stays a
+            # loop rather than an np.diff() split
             current_line = []
+            current_bboxes = []
             current_y = None
 
-            for word in words:
-                bbox = self._parse_bbox(word.get('title', ''))
+            for i in order:
+                word, bbox = all_words[i], bboxes[i]
 
                 if current_y is None or abs(bbox.y1 - current_y) <= Y_TOLERANCE:
                     current_line.append(word)
+                    current_bboxes.append(bbox)
                     if current_y is None:
                         current_y = bbox.y1
                 else:
                     # Process previous line
                     if current_line:
-                        first_bbox = self._parse_bbox(current_line[0].get('title', ''))
-                        line_y_pt = page_height_pt - (first_bbox.y2 / dpi) * 72.0
+                        line_y_pt = page_height_pt - (current_bboxes[0].y2 / dpi) * 72.0
                         line_word_count = self._build_line_with_tj(
-                            content, current_line, line_y_pt, page_height_pt, dpi
+                            buf, current_line, line_y_pt, page_height_pt, dpi,
+                            current_bboxes
                         )
                         word_count += line_word_count
                         if line_word_count > 0:
@@ -331,29 +543,31 @@ class PikePDFEngine:
 
                     # Start new line
                     current_line = [word]
+                    current_bboxes = [bbox]
                     current_y = bbox.y1
 
             # Process last line
             if current_line:
-                first_bbox = self._parse_bbox(current_line[0].get('title', ''))
-                line_y_pt = page_height_pt - (first_bbox.y2 / dpi) * 72.0
+                line_y_pt = page_height_pt - (current_bboxes[0].y2 / dpi) * 72.0
                 line_word_count = self._build_line_with_tj(
-                    content, current_line, line_y_pt, page_height_pt, dpi
+                    buf, current_line, line_y_pt, page_height_pt, dpi,
+                    current_bboxes
                 )
                 word_count += line_word_count
                 if line_word_count > 0:
                     line_count += 1
 
-        Print("DEBUG", f"Text layer: {word_count} words in {line_count} lines (TJ operator)")
-        return content
+        if debug_enabled():
+            Print("DEBUG", f"Text layer: {word_count} words in {line_count} lines (TJ operator)")
 
     def _build_line_with_tj(
         self,
-        content: List[bytes],
+        buf: bytearray,
         words: list,
         line_y_pt: float,
         page_height_pt: float,
-        dpi: int
+        dpi: int,
+        bboxes: Optional[List[BoundingBox]] = None
     ) -> int:
         """
         Build a text line using the TJ operator for proper text extraction.
@@ -367,11 +581,12 @@ class PikePDFEngine:
         recognizes as one line, preventing text scrambling.
 
         Args:
-            content: Content stream list to append to
+            buf: Content stream buffer to append to
             words: List of word elements in this line
             line_y_pt: Y coordinate for this line
             page_height_pt: Page height in PDF points
             dpi: Source image DPI
+            bboxes: Already parsed bounding boxes, one per word (optional)
 
         Returns:
             Number of words processed
@@ -381,11 +596,11 @@ class PikePDFEngine:
 
         # Collect word data
         word_data = []
-        for word in words:
+        for i, word in enumerate(words):
             word_text = self._get_element_text(word)
             if not word_text:
                 continue
-            bbox = self._parse_bbox(word.get('title', ''))
+            bbox = bboxes[i] if bboxes is not None else self._parse_bbox(word.get('title', ''))
             if bbox.width <= 0 or bbox.height <= 0:
                 continue
 
@@ -404,16 +619,18 @@ class PikePDFEngine:
             return 0
 
         # Begin text object for this line
-        content.append(b'BT')
-        content.append(f'{self.rendering_mode} Tr'.encode('latin-1'))
+        # Operators are formatted with bytes %-formatting: C-level number
+        # formatting, same rounding as format(), and no encode step
+        buf += b'BT\n'
+        buf += b'%d Tr\n' % self.rendering_mode
 
         # Use a consistent font size for the line (average or first word's size)
         avg_font_size = sum(w['font_size'] for w in word_data) / len(word_data)
-        content.append(f'/F1 {avg_font_size:.1f} Tf'.encode('latin-1'))
+        buf += b'/F1 %.1f Tf\n' % avg_font_size
 
         # Position at first word
         first_x = word_data[0]['x_pt']
-        content.append(f'1 0 0 1 {first_x:.2f} {line_y_pt:.2f} Tm'.encode('latin-1'))
+        buf += b'1 0 0 1 %.2f %.2f Tm\n' % (first_x, line_y_pt)
 
         # Build TJ array with explicit space characters between words
         # The TJ array format: [(text) kern (text) kern ...] TJ
@@ -437,23 +654,21 @@ class PikePDFEngine:
             # Add space between words (not before first word)
             if i > 0:
                 # Small kern + explicit space character
-                tj_parts.append(str(WORD_SPACE_KERN))
-                tj_parts.append('( )')
+                tj_parts.append(b'%d' % WORD_SPACE_KERN)
+                tj_parts.append(b'( )')
 
             # Add the word text
-            escaped = self._escape_pdf_string(wd['text']).decode('latin-1')
-            tj_parts.append(f'({escaped})')
+            tj_parts.append(b'(%s)' % self._escape_pdf_string(wd['text']))
 
         # Build the TJ command
-        tj_array = ' '.join(tj_parts)
-        content.append(f'[{tj_array}] TJ'.encode('latin-1'))
+        buf += b'[%s] TJ\n' % b' '.join(tj_parts)
 
         # End text object
-        content.append(b'ET')
+        buf += b'ET\n'
 
         return len(word_data)
 
-    def _build_image_layer(self, width_pt: float, height_pt: float) -> List[bytes]:
+    def _build_image_layer(self, buf: bytearray, width_pt: float, height_pt: float) -> None:
         """
         Build image drawing commands for content stream.
 
@@ -467,20 +682,17 @@ class PikePDFEngine:
         - Q: Restore graphics state
 
         Args:
+            buf: Content stream buffer to append to (this is the last part
+                 of the stream, so no trailing newline)
             width_pt: Page width in PDF points
             height_pt: Page height in PDF points
-
-        Returns:
-            List of PDF content stream commands as bytes
         """
-        return [
-            b'q',  # Save graphics state
-            # Transformation matrix: scale image to page size
-            # [width 0 0 height 0 0] scales and positions at origin
-            f'{width_pt:.2f} 0 0 {height_pt:.2f} 0 0 cm'.encode('latin-1'),
-            b'/Im1 Do',  # Draw image XObject named 'Im1'
-            b'Q'   # Restore graphics state
-        ]
+        buf += b'q\n'  # Save graphics state
+        # Transformation matrix: scale image to page size
+        # [width 0 0 height 0 0] scales and positions at origin
+        buf += b'%.2f 0 0 %.2f 0 0 cm\n' % (width_pt, height_pt)
+        buf += b'/Im1 Do\n'  # Draw image XObject named 'Im1'
+        buf += b'Q'  # Restore graphics state
 
     def _create_page(
         self,
@@ -507,38 +719,29 @@ class PikePDFEngine:
         Returns:
             The created page object
         """
-        # Create image XObject
-        image_stream = pikepdf.Stream(pdf, image_bytes)
-        image_stream.stream_dict[pikepdf.Name.Type] = pikepdf.Name.XObject
-        image_stream.stream_dict[pikepdf.Name.Subtype] = pikepdf.Name.Image
-        image_stream.stream_dict[pikepdf.Name.Width] = width_px
-        image_stream.stream_dict[pikepdf.Name.Height] = height_px
-        image_stream.stream_dict[pikepdf.Name.ColorSpace] = pikepdf.Name.DeviceRGB
-        image_stream.stream_dict[pikepdf.Name.BitsPerComponent] = 8
-
-        # Set compression filter
-        filter_name = compressor.filter_name
-        image_stream.stream_dict[pikepdf.Name.Filter] = pikepdf.Name(f'/{filter_name}')
-
-        # Make image object indirect (required for XObjects)
-        image_obj = pdf.make_indirect(image_stream)
-
-        # Create font dictionary (Base 14 font - no embedding needed)
-        font_dict = pikepdf.Dictionary(
-            Type=pikepdf.Name.Font,
-            Subtype=pikepdf.Name.Type1,
-            BaseFont=pikepdf.Name(f'/{self.font_name}')
+        # Create image XObject, with its whole dictionary in one call
+        image_stream = pikepdf.Stream(
+            pdf, image_bytes,
+            Type=pikepdf.Name.XObject,
+            Subtype=pikepdf.Name.Image,
+            Width=width_px,
+            Height=height_px,
+            ColorSpace=pikepdf.Name.DeviceRGB,
+            BitsPerComponent=8,
+            Filter=_filter_name(compressor.filter_name)
         )
-        font_obj = pdf.make_indirect(font_dict)
 
-        # Create resources dictionary
+        # Create resources dictionary. Streams are always indirect objects,
+        # so Stream(pdf, ...) is already registered in pdf; make_indirect()
+        # on it would only add a second copy
         resources = pikepdf.Dictionary(
-            XObject=pikepdf.Dictionary(Im1=image_obj),
-            Font=pikepdf.Dictionary(F1=font_obj)
+            XObject=pikepdf.Dictionary(Im1=image_stream),
+            Font=self._get_font_resources(pdf)
         )
 
-        # Create content stream object
-        content_obj = pdf.make_indirect(pikepdf.Stream(pdf, content_stream))
+        # Create content stream object. The bytes are stored as they are:
+        # nothing here parses them, and qpdf writes /Length on save
+        content_obj = pikepdf.Stream(pdf, content_stream)
 
         # Add blank page first, then modify it
         # This is the correct way to create pages in pikepdf
@@ -550,16 +753,40 @@ class PikePDFEngine:
 
         return page
 
+    def _get_font_resources(self, pdf: pikepdf.Pdf) -> pikepdf.Object:
+        """
+        Return the /Font resource dict shared by every page of pdf.
+
+        The font is the same on every page, so it is created once per
+        document rather than once per page.
+
+        Args:
+            pdf: Document the page is being added to
+
+        Returns:
+            Indirect dictionary mapping /F1 to the Base 14 font
+        """
+        fonts = self._font_resources
+        if fonts is not None and fonts.is_owned_by(pdf):
+            return fonts
+
+        # Create font dictionary (Base 14 font - no embedding needed)
+        font_dict = pikepdf.Dictionary(
+            Type=pikepdf.Name.Font,
+            Subtype=pikepdf.Name.Type1,
+            BaseFont=pikepdf.Name(f'/{self.font_name}')
+        )
+        font_obj = pdf.make_indirect(font_dict)
+
+        fonts = pdf.make_indirect(pikepdf.Dictionary(F1=font_obj))
+        self._font_resources = fonts
+        return fonts
+
     def _get_element_text(self, element) -> str:
         """Extract text content from an lxml element."""
-        # Get all text including from child elements
-        text_parts = []
-        if element.text:
-            text_parts.append(element.text)
-        for child in element:
-            if child.tail:
-                text_parts.append(child.tail)
-        return ''.join(text_parts).strip()
+        # Get all text including from child elements (e.g. Tesseract's
+        # <strong>/<em> around bold and italic words)
+        return ''.join(element.itertext()).strip()
 
     def _parse_bbox(self, title: str) -> BoundingBox:
         """
@@ -574,31 +801,24 @@ class PikePDFEngine:
         Returns:
             BoundingBox with parsed coordinates
         """
-        if not title:
+        # One regex match instead of split/strip/split plus list checks;
+        # like before, only a bbox in the first property counts
+        match = _BBOX_RE.match(title) if title else None
+        if match is None:
             return BoundingBox(0, 0, 0, 0)
 
-        try:
-            # Extract bbox part (before semicolon)
-            bbox_part = title.split(';')[0].strip()
-
-            # Parse "bbox x1 y1 x2 y2"
-            parts = bbox_part.split()
-            if len(parts) >= 5 and parts[0] == 'bbox':
-                return BoundingBox(
-                    x1=int(parts[1]),
-                    y1=int(parts[2]),
-                    x2=int(parts[3]),
-                    y2=int(parts[4])
-                )
-        except (ValueError, IndexError):
-            pass
+        x1, y1, x2, y2 = match.groups()
+        return BoundingBox(int(x1), int(y1), int(x2), int(y2))
 
-        return BoundingBox(0, 0, 0, 0)
-
-    def _escape_pdf_string(self, text: str) -> bytes:
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _escape_pdf_string(text: str) -> bytes:
         """
         Escape and encode text for PDF string literals.
 
+        OCR text repeats the same short words constantly, and the result only
+        depends on the text, so results are memoized across pages.
+
         PDF string literals use parentheses: (text here)
         For Unicode text, we use UTF-16BE encoding with BOM.
 
@@ -613,75 +833,66 @@ class PikePDFEngine:
         Returns:
             Escaped text as bytes, safe for PDF string literal
         """
-        # For ASCII-only text, use simple escaping
-        try:
-            # Try to encode as ASCII first
-            text.encode('ascii')
-
-            # Escape special PDF characters
-            text = text.replace('\\', '\\\\')
-            text = text.replace('(', '\\(')
-            text = text.replace(')', '\\)')
-            text = text.replace('\n', '\\n')
-            text = text.replace('\r', '\\r')
-            text = text.replace('\t', '\\t')
-
-            return text.encode('latin-1')
-
-        except (UnicodeEncodeError, UnicodeDecodeError):
-            # For Unicode text, use hex string encoding
-            # PDF hex strings: <hexadecimal bytes>
-            # We'll encode as UTF-16BE which PDF readers understand
-
-            # Normalize common Unicode characters to ASCII equivalents
-            # This handles smart quotes, em-dashes, etc.
-            replacements = {
-                '\u2018': "'",   # Left single quote
-                '\u2019': "'",   # Right single quote
-                '\u201c': '"',   # Left double quote
-                '\u201d': '"',   # Right double quote
-                '\u2013': '-',   # En dash
-                '\u2014': '-',   # Em dash
-                '\u2026': '...', # Ellipsis
-                '\u00a0': ' ',   # Non-breaking space
-                '\ufb01': 'fi',  # fi ligature
-                '\ufb02': 'fl',  # fl ligature
-            }
-
-            for unicode_char, ascii_char in replacements.items():
-                text = text.replace(unicode_char, ascii_char)
-
-            # Try ASCII again after replacements
-            try:
-                text.encode('ascii')
-                text = text.replace('\\', '\\\\')
-                text = text.replace('(', '\\(')
-                text = text.replace(')', '\\)')
-                return text.encode('latin-1')
-            except UnicodeEncodeError:
-                # Still has non-ASCII, fall back to removing problematic chars
-                # This preserves the word structure for searchability
-                ascii_text = text.encode('ascii', errors='ignore').decode('ascii')
-                ascii_text = ascii_text.replace('\\', '\\\\')
-                ascii_text = ascii_text.replace('(', '\\(')
-                ascii_text = ascii_text.replace(')', '\\)')
-                return ascii_text.encode('latin-1')
+        # isascii() is a flag check on the str object: no encode attempt
+        # and no exception in the common case
+        if text.isascii():
+            return text.translate(_PDF_ESCAPE_TABLE).encode('latin-1')
+
+        # Normalize common Unicode characters to ASCII equivalents
+        # This handles smart quotes, em-dashes, etc.
+        text = text.translate(_UNICODE_TO_ASCII)
+
+        # Anything still non-ASCII is dropped; this preserves the word
+        # structure for searchability
+        if not text.isascii():
+            text = text.encode('ascii', errors='ignore').decode('ascii')
+        return text.translate(_PDF_DELIMITER_ESCAPE_TABLE).encode('latin-1')
 
     def _convert_to_rgb(self, img: Image.Image) -> Image.Image:
         """Convert image to RGB mode, handling transparency."""
-        if img.mode == 'RGBA':
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])
-            return background
+        if img.mode in ('RGBA', 'LA') and img.getextrema()[-1][0] == 255:
+            # Fully opaque: nothing to composite
+            return img.convert('RGB')
+        elif img.mode == 'RGBA':
+            # alpha_composite is a single C pass; no split() band copies
+            background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+            background.alpha_composite(img)
+            return background.convert('RGB')
         elif img.mode == 'LA':
-            background = Image.new('L', img.size, 255)
-            background.paste(img, mask=img.split()[1])
+            # getchannel() extracts only the bands needed, unlike split()
+            background = Image.composite(
+                img.getchannel('L'),
+                Image.new('L', img.size, 255),
+                img.getchannel('A')
+            )
             return background.convert('RGB')
         elif img.mode == 'P':
             return img.convert('RGB')
         else:
             return img.convert('RGB')
 
+    def open_output(self, output_path: Path) -> 'PDFOutput':
+        """
+        Open a document that pages are appended to as they are produced.
+
+        Use as a context manager; the document is saved to output_path on a
+        clean exit. With flush_every set, memory stays flat regardless of
+        page count.
+
+        Args:
+            output_path: Where the finished PDF is written
+
+        Returns:
+            PDFOutput for add_page() calls
+        """
+        return PDFOutput(self, Path(output_path), self.flush_every)
+
+    def __getstate__(self) -> dict:
+        """Pickle support for process pools; the font cache belongs to a Pdf."""
+        state = self.__dict__.copy()
+        state['_font_resources'] = None
+        return state
+
     def merge_pages(self, pages: List[pikepdf.Pdf]) -> pikepdf.Pdf:
         """
         Merge multiple single-page PDFs into one document.
@@ -711,3 +922,88 @@ class PikePDFEngine:
     def name(self) -> str:
         """Engine identifier."""
         return "pikepdf"
+
+
+class PDFOutput:
+    """
+    A PDF being written page by page by PikePDFEngine.open_output().
+
+    Every flush_every pages the document is saved to a scratch file next to
+    the output and reopened from it. pikepdf reads reopened objects lazily,
+    so image data of flushed pages is dropped from memory instead of
+    accumulating until the final save.
+    """
+
+    def __init__(self, engine: PikePDFEngine, output_path: Path, flush_every: int = 0):
+        self.engine = engine
+        self.output_path = output_path
+        self.flush_every = flush_every
+        self.pdf = pikepdf.Pdf.new()
+        self.page_count = 0
+        self._scratch_paths = [
+            output_path.with_name(f".{output_path.name}.{i}.partial")
+            for i in range(2)
+        ]
+        self._flushes = 0
+
+    def __enter__(self) -> 'PDFOutput':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.save()
+        finally:
+            self.pdf.close()
+            for path in self._scratch_paths:
+                path.unlink(missing_ok=True)
+
+    def add_page(
+        self,
+        image_path: Path,
+        hocr_path: Union[Path, bytes],
+        dpi: int,
+        compressor
+    ) -> None:
+        """Create a searchable page and append it; arguments as for create_searchable_page."""
+        self.engine.create_searchable_page(image_path, hocr_path, dpi, compressor, pdf=self.pdf)
+        self._page_added()
+
+    def add_prepared_page(self, prepared: PreparedPage, compressor) -> None:
+        """Append a page from PikePDFEngine.prepare_page()."""
+        self.engine.add_prepared_page(prepared, compressor, self.pdf)
+        self._page_added()
+
+    def _page_added(self) -> None:
+        self.page_count += 1
+        if self.flush_every and self.page_count % self.flush_every == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pages so far to disk and continue from the saved file."""
+        # The file being read can't be overwritten, so alternate two scratch files
+        path = self._scratch_paths[self._flushes % 2]
+        self._flushes += 1
+
+        self.pdf.save(str(path))
+        self.pdf.close()
+        self.pdf = pikepdf.open(str(path))
+
+        # Keep sharing the font resources already in the document
+        if len(self.pdf.pages):
+            self.engine._font_resources = self.pdf.pages[-1].Resources.Font
+
+        if debug_enabled():
+            Print("DEBUG", f"Flushed {self.page_count} pages to {path.name}")
+
+    def save(self) -> None:
+        """Write the finished document to output_path."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pdf.save(
+            str(self.output_path),
+            object_stream_mode=(
+                pikepdf.ObjectStreamMode.generate if self.engine.object_streams
+                else pikepdf.ObjectStreamMode.preserve
+            ),
+            linearize=self.engine.linearize
+        )
@@ -32,20 +32,252 @@ Or from command line:
 """
 
 import json
+import os
 import shutil
 import tempfile
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 from PIL import Image
 
 from engines.ocr import get_ocr_engine
 from engines.pdf import get_pdf_engine
 from engines.compression import get_compressor
 from processors.dehyphenation import Dehyphenator
-from utilities import Print
+from utilities import Print, debug_enabled, set_debug_enabled
+
+
+@dataclass
+class PageTask:
+    """One page of work for _process_pages(), picklable for worker processes."""
+    page_num: int
+    image_path: Path
+    hocr_base: Path
+    dpi: int
+    dehyphenate: bool
+    # Rendered pages are scratch files; user-supplied images are not
+    delete_image: bool
+    keep_temp: bool
+
+
+@dataclass
+class PageResult:
+    """A page ready for the PDF engine's add_prepared_page()."""
+    page_num: int
+    prepared: object
+    dehyphenated: int
+
+
+def _create_engines(
+    config: dict,
+    ocr_engine_name: str,
+    pdf_engine_name: str,
+    compression: str
+) -> Tuple[object, object, object, Dehyphenator]:
+    """
+    Create and initialize the OCR engine, PDF engine, compressor and dehyphenator.
+
+    Returns:
+        (ocr_engine, pdf_engine, compressor, dehyphenator)
+    """
+    ocr_config = config['ocr_engines'].get(ocr_engine_name, {})
+
+    # Pages are parallelized across processes, so each Tesseract should use
+    # one thread. The CLI engine passes this to its children itself; an
+    # in-process engine (tesserocr) only sees it if it is set before the
+    # library and its OpenMP runtime are loaded
+    omp_threads = ocr_config.get('omp_thread_limit', 1)
+    if omp_threads:
+        os.environ.setdefault('OMP_THREAD_LIMIT', str(omp_threads))
+
+    ocr_engine = get_ocr_engine(ocr_engine_name, ocr_config)
+    ocr_engine.initialize(ocr_config)
+
+    pdf_config = config['pdf_engines'].get(pdf_engine_name, {})
+    pdf_engine = get_pdf_engine(pdf_engine_name, pdf_config)
+
+    comp_config = config['compression'].get(compression, {})
+    compressor = get_compressor(compression, comp_config)
+
+    dehyp_config = config['processing'].get('dehyphenation', {'enabled': True})
+    dehyphenator = Dehyphenator(dehyp_config)
+
+    return ocr_engine, pdf_engine, compressor, dehyphenator
+
+
+def _recognize_page(engines: tuple, task: PageTask) -> Tuple[Path, int, Image.Image]:
+    """
+    OCR and dehyphenate one page (stages 2-3).
+
+    Args:
+        engines: (ocr_engine, pdf_engine, compressor, dehyphenator)
+        task: Page to process
+
+    Returns:
+        (hocr_path, number of words merged, the opened page image); the
+        image is kept open so stage 4 compresses it without decoding the
+        file again
+    """
+    ocr_engine = engines[0]
+
+    # Stage 2: OCR → hOCR
+    if debug_enabled():
+        Print("DEBUG", f"  Page {task.page_num}: running OCR...")
+    img = _open_page_image(task)
+    try:
+        hocr_path = ocr_engine.recognize_to_hocr(img, output_path=task.hocr_base)
+        merged = _dehyphenate_page(engines, task, hocr_path)
+    except BaseException:
+        img.close()
+        raise
+
+    return hocr_path, merged, img
+
+
+def _recognize_pages(
+    engines: tuple,
+    tasks: List[PageTask]
+) -> List[Tuple[Path, int, Image.Image]]:
+    """
+    OCR and dehyphenate several pages with one recognize_batch_to_hocr() call.
+
+    For the tesseract CLI the model is then loaded once per batch instead of
+    once per page; in-process engines simply recognize the pages in order.
+
+    Returns:
+        One _recognize_page() result per task, in order
+    """
+    if len(tasks) == 1:
+        return [_recognize_page(engines, tasks[0])]
+
+    ocr_engine = engines[0]
+
+    if debug_enabled():
+        Print("DEBUG", f"  Pages {tasks[0].page_num}-{tasks[-1].page_num}: running OCR...")
+    images = []
+    try:
+        for task in tasks:
+            images.append(_open_page_image(task))
+        hocr_paths = ocr_engine.recognize_batch_to_hocr(
+            images, output_paths=[task.hocr_base for task in tasks]
+        )
+        merged = [
+            _dehyphenate_page(engines, task, hocr_path)
+            for task, hocr_path in zip(tasks, hocr_paths)
+        ]
+    except BaseException:
+        for img in images:
+            img.close()
+        raise
+
+    return list(zip(hocr_paths, merged, images))
+
+
+def _open_page_image(task: PageTask) -> Image.Image:
+    """Open a page image, recording the render DPI so the OCR engine can
+    honour its ocr_dpi setting."""
+    img = Image.open(task.image_path)
+    img.info['dpi'] = (task.dpi, task.dpi)
+    return img
+
+
+def _dehyphenate_page(engines: tuple, task: PageTask, hocr_path: Path) -> int:
+    """Stage 3: dehyphenate hOCR in place; returns the number of words merged."""
+    if not task.dehyphenate:
+        return 0
+
+    merged = engines[3].process_file(hocr_path)
+    if merged > 0 and debug_enabled():
+        Print("DEBUG", f"  Page {task.page_num}: dehyphenated {merged} word pairs")
+    return merged
+
+
+def _prepare_page(
+    engines: tuple,
+    task: PageTask,
+    hocr_path: Path,
+    merged: int,
+    img: Image.Image
+) -> PageResult:
+    """
+    Compress the image and build the page content of an OCR'd page (stage 4).
+
+    Args:
+        engines: (ocr_engine, pdf_engine, compressor, dehyphenator)
+        task: Page to process
+        hocr_path, merged, img: Result of _recognize_page(); img is closed
+
+    Returns:
+        PageResult with the prepared page and the number of words merged
+    """
+    _, pdf_engine, compressor, _ = engines
+
+    if debug_enabled():
+        Print("DEBUG", f"  Page {task.page_num}: creating PDF page...")
+    with img:
+        prepared = pdf_engine.prepare_page(
+            task.image_path, hocr_path, task.dpi, compressor, image=img
+        )
+
+    # Cleanup temp files for this page (unless debugging)
+    if not task.keep_temp:
+        if task.delete_image:
+            task.image_path.unlink(missing_ok=True)
+        hocr_path.unlink(missing_ok=True)
+
+    return PageResult(task.page_num, prepared, merged)
+
+
+def _process_pages(engines: tuple, tasks: List[PageTask]) -> List[PageResult]:
+    """OCR, dehyphenate and prepare a batch of pages (stages 2-4)."""
+    recognized = _recognize_pages(engines, tasks)
+    try:
+        return [
+            _prepare_page(engines, task, *page)
+            for task, page in zip(tasks, recognized)
+        ]
+    finally:
+        # _prepare_page() closes each image it handles; if one fails, the
+        # images of the remaining pages are still open
+        for _, _, img in recognized:
+            img.close()
+
+
+def _batched(tasks: Iterable[PageTask], size: int) -> Iterator[List[PageTask]]:
+    """Group tasks into lists of up to size pages, consuming tasks lazily."""
+    tasks = iter(tasks)
+    while batch := list(islice(tasks, size)):
+        yield batch
+
+
+# Pages the OCR thread may run ahead of page preparation in-process; each
+# holds its decoded image, so keep this small
+_OVERLAP_DEPTH = 2
+
+# Engines of a pool worker process, created once by _init_worker()
+_worker_engines: Optional[tuple] = None
+
+
+def _init_worker(config: dict, engine_names: tuple, debug: bool) -> None:
+    """ProcessPoolExecutor initializer: load the engines once per worker."""
+    global _worker_engines
+    set_debug_enabled(debug)
+    _worker_engines = _create_engines(config, *engine_names)
+
+
+def _process_page_batch(tasks: List[PageTask]) -> List[PageResult]:
+    """Pool entry point; runs _process_pages() with the worker's engines."""
+    return _process_pages(_worker_engines, tasks)
 
 
 class MorphicPipeline:
@@ -57,7 +289,10 @@ class MorphicPipeline:
     2. Images → hOCR (Tesseract OCR)
     3. hOCR → Dehyphenated hOCR (Dehyphenator)
     4. Image + hOCR → Searchable PDF page (pikepdf + JPEG2000)
-    5. Merge pages → Final PDF
+    5. Pages → Final PDF
+
+    Stages 2-4 run per page, in a process pool when processing.workers
+    allows more than one worker.
 
     Attributes:
         config: Loaded configuration dictionary
@@ -65,7 +300,16 @@ class MorphicPipeline:
         pdf_engine: Initialized PDF engine instance
         compressor: Initialized image compressor instance
         dehyphenator: Initialized dehyphenation processor
-        temp_dir: Path to temporary working directory
+        temp_dir: Path to temporary working directory (one job_* sub-directory
+                  per process_pdf()/process_images() call)
+
+    Engines, worker processes and the temp directory live until close(), so
+    one pipeline can process many documents; use it as a context manager:
+
+        with MorphicPipeline() as pipeline:
+            pipeline.initialize()
+            for pdf in pdfs:
+                pipeline.process_pdf(pdf, out_dir / pdf.name)
     """
 
     def __init__(self, config_path: Optional[Path] = None):
@@ -81,6 +325,36 @@ class MorphicPipeline:
         self.compressor = None
         self.dehyphenator = None
         self.temp_dir = None
+        self._engine_names = None
+        self._executor = None
+        self._executor_workers = 0
+        self._keep_temp_dir = False
+        self._dehyphenation_enabled = False
+        self._initialized = False
+
+    def __enter__(self) -> 'MorphicPipeline':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the worker processes, release the engines and remove the temp
+        directory (unless a job ran with keep_temp).
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        close_ocr = getattr(self.ocr_engine, 'close', None)
+        if close_ocr is not None:
+            close_ocr()
+
+        if self.temp_dir is not None and not self._keep_temp_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+
         self._initialized = False
 
     def _load_config(self, config_path: Optional[Path]) -> dict:
@@ -113,7 +387,10 @@ class MorphicPipeline:
         This must be called before process_pdf().
 
         Args:
-            ocr_engine_name: Name of OCR engine to use (default: tesseract)
+            ocr_engine_name: Name of OCR engine to use (default: tesseract;
+                             'tesserocr' keeps the model loaded in each
+                             process and falls back to the tesseract CLI
+                             when tesserocr is not installed)
             pdf_engine_name: Name of PDF engine to use (default: pikepdf)
             compression: Name of compression strategy (default: jpeg2000)
 
@@ -123,34 +400,29 @@ class MorphicPipeline:
         """
         Print("STARTING", f"Initializing Morphic v{self.config.get('version', '0.2.0')} pipeline")
 
-        # Initialize OCR engine
-        ocr_config = self.config['ocr_engines'].get(ocr_engine_name, {})
-        self.ocr_engine = get_ocr_engine(ocr_engine_name, ocr_config)
-        self.ocr_engine.initialize(ocr_config)
+        # Initialize engines (pool workers repeat this with the same names)
+        self._engine_names = (ocr_engine_name, pdf_engine_name, compression)
+        self.ocr_engine, self.pdf_engine, self.compressor, self.dehyphenator = (
+            _create_engines(self.config, *self._engine_names)
+        )
         Print("SUCCESS", f"OCR engine: {self.ocr_engine.name}")
-
-        # Initialize PDF engine
-        pdf_config = self.config['pdf_engines'].get(pdf_engine_name, {})
-        self.pdf_engine = get_pdf_engine(pdf_engine_name, pdf_config)
         Print("SUCCESS", f"PDF engine: {self.pdf_engine.name}")
-
-        # Initialize compressor
-        comp_config = self.config['compression'].get(compression, {})
-        self.compressor = get_compressor(compression, comp_config)
         Print("SUCCESS", f"Compressor: {self.compressor.name}")
 
-        # Initialize dehyphenator
+        # Fixed for the pipeline's lifetime; resolved once instead of per job
         dehyp_config = self.config['processing'].get('dehyphenation', {'enabled': True})
-        self.dehyphenator = Dehyphenator(dehyp_config)
-        if dehyp_config.get('enabled', True):
+        self._dehyphenation_enabled = bool(dehyp_config.get('enabled', True))
+        if self._dehyphenation_enabled:
             Print("SUCCESS", f"Dehyphenation: enabled (dictionary: {dehyp_config.get('dictionary', 'en_US')})")
         else:
             Print("INFO", "Dehyphenation: disabled")
 
-        # Create temp directory
-        temp_base = self.config['processing'].get('temp_dir', '/tmp/morphic')
-        self.temp_dir = Path(temp_base) / f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        # Create temp directory; unique even for pipelines started in the same second
+        temp_base = Path(self.config['processing'].get('temp_dir', '/tmp/morphic'))
+        temp_base.mkdir(parents=True, exist_ok=True)
+        self.temp_dir = Path(tempfile.mkdtemp(
+            prefix=f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_", dir=temp_base
+        ))
         Print("DEBUG", f"Temp directory: {self.temp_dir}")
 
         self._initialized = True
@@ -195,15 +467,17 @@ class MorphicPipeline:
         input_pdf = Path(input_pdf)
         output_pdf = Path(output_pdf)
 
-        if not input_pdf.exists():
-            raise FileNotFoundError(f"Input PDF not found: {input_pdf}")
+        # One stat() both checks existence and gets the size
+        try:
+            input_size = os.stat(input_pdf).st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input PDF not found: {input_pdf}") from None
 
         # Use configured DPI if not specified
         if dpi is None:
             dpi = self.config['processing'].get('default_dpi', 600)
 
-        start_time = datetime.now()
-        input_size = input_pdf.stat().st_size
+        start_ns = time.perf_counter_ns()
 
         Print("STATE", f"Processing: {input_pdf.name}")
         Print("INFO", f"Input size: {input_size / (1024*1024):.2f} MB")
@@ -214,89 +488,55 @@ class MorphicPipeline:
         # =====================================================================
         Print("PROGRESS", "Stage 1/5: Extracting pages from PDF...")
 
-        pages = convert_from_path(
-            input_pdf,
-            dpi=dpi,
-            first_page=first_page,
-            last_page=last_page
-        )
+        # Pages are rendered a batch at a time as the workers need them, so
+        # neither bitmaps nor rendered files accumulate for the whole document
+        page_count = pdfinfo_from_path(str(input_pdf))['Pages']
+        first_page = max(1, first_page or 1)
+        last_page = min(page_count, last_page or page_count)
+        total_pages = max(0, last_page - first_page + 1)
+        Print("INFO", f"Extracting {total_pages} page{'s' if total_pages != 1 else ''}")
 
-        total_pages = len(pages)
-        Print("INFO", f"Extracted {total_pages} page{'s' if total_pages != 1 else ''}")
+        job_dir = self._new_job_dir(keep_temp)
+        page_paths = self._render_pages(input_pdf, dpi, first_page, last_page, job_dir)
 
         # =====================================================================
         # Stage 2-4: Process each page
         # =====================================================================
-        pdf_pages = []
-        total_dehyphenated = 0
-
-        for page_num, img in enumerate(pages, 1):
-            Print("PROGRESS", f"Processing page {page_num}/{total_pages}")
-
-            # Create temp paths for this page
-            page_base = self.temp_dir / f"page_{page_num}"
-            img_path = page_base.with_suffix('.png')
-
-            # Save image temporarily
-            img.save(img_path, format='PNG')
-            Print("DEBUG", f"  Saved image: {img.size[0]}x{img.size[1]} px")
-
-            # Stage 2: OCR → hOCR
-            Print("DEBUG", f"  Running OCR...")
-            hocr_path = self.ocr_engine.recognize_to_hocr(
-                img,
-                output_path=page_base
-            )
-
-            # Stage 3: Dehyphenate hOCR
-            if self.config['processing']['dehyphenation'].get('enabled', True):
-                merged = self.dehyphenator.process_file(hocr_path)
-                total_dehyphenated += merged
-                if merged > 0:
-                    Print("DEBUG", f"  Dehyphenated: {merged} word pairs")
-
-            # Stage 4: Create searchable PDF page
-            Print("DEBUG", f"  Creating PDF page...")
-            page_pdf = self.pdf_engine.create_searchable_page(
-                image_path=img_path,
-                hocr_path=hocr_path,
-                dpi=dpi,
-                compressor=self.compressor
+        tasks = (
+            PageTask(
+                page_num, img_path, job_dir / f"page_{page_num}", dpi,
+                self._dehyphenation_enabled, delete_image=True, keep_temp=keep_temp
             )
-            pdf_pages.append(page_pdf)
-
-            # Cleanup temp files for this page (unless debugging)
-            if not keep_temp:
-                img_path.unlink(missing_ok=True)
-                hocr_path.unlink(missing_ok=True)
-
-        # =====================================================================
-        # Stage 5: Merge pages into final PDF
-        # =====================================================================
-        Print("PROGRESS", "Stage 5/5: Merging pages...")
+            for page_num, img_path in enumerate(page_paths, 1)
+        )
 
-        final_pdf = self.pdf_engine.merge_pages(pdf_pages)
+        # Pages are appended to the output document in order as they finish
+        total_dehyphenated = 0
 
-        # Ensure output directory exists
-        output_pdf.parent.mkdir(parents=True, exist_ok=True)
+        with self.pdf_engine.open_output(output_pdf) as output:
+            for result in self._run_pages(tasks):
+                Print("PROGRESS", f"Processed page {result.page_num}/{total_pages}")
+                output.add_prepared_page(result.prepared, self.compressor)
+                total_dehyphenated += result.dehyphenated
 
-        # Save final PDF
-        final_pdf.save(str(output_pdf))
+            # =================================================================
+            # Stage 5: Save final PDF (on leaving the with block)
+            # =================================================================
+            Print("PROGRESS", "Stage 5/5: Saving PDF...")
 
         # =====================================================================
         # Cleanup and statistics
         # =====================================================================
-        if not keep_temp and self.temp_dir.exists():
+        if not keep_temp:
             try:
-                shutil.rmtree(self.temp_dir)
+                shutil.rmtree(job_dir)
                 Print("DEBUG", "Cleaned up temp directory")
             except Exception as e:
                 Print("WARNING", f"Could not clean temp directory: {e}")
 
         # Calculate statistics
-        end_time = datetime.now()
-        output_size = output_pdf.stat().st_size
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        output_size = os.stat(output_pdf).st_size
 
         # Compression ratio (input / output)
         compression_ratio = input_size / output_size if output_size > 0 else 0
@@ -320,6 +560,173 @@ class MorphicPipeline:
 
         return stats
 
+    def _render_pages(
+        self,
+        input_pdf: Path,
+        dpi: int,
+        first_page: int,
+        last_page: int,
+        output_dir: Path
+    ) -> Iterator[Path]:
+        """
+        Render pages to image files in output_dir, yielding their paths.
+
+        poppler renders a batch of pages split over render_threads parallel
+        pdftoppm processes and writes the files itself; only paths come back,
+        and the next batch is rendered once the caller has taken this one.
+
+        The files are read once and deleted, so they are written as raw PPM
+        by default (processing.render_format): no DEFLATE on the way out and
+        no inflate when the page is loaded for OCR.
+        """
+        render_threads = (
+            self.config['processing'].get('render_threads')
+            or max(1, (os.cpu_count() or 2) - 1)
+        )
+        # A few pages per pdftoppm process amortizes its document load
+        batch_size = 4 * render_threads
+        render_format = self.config['processing'].get('render_format', 'ppm')
+
+        for batch_first in range(first_page, last_page + 1, batch_size):
+            batch_last = min(last_page, batch_first + batch_size - 1)
+            page_paths = convert_from_path(
+                input_pdf,
+                dpi=dpi,
+                first_page=batch_first,
+                last_page=batch_last,
+                thread_count=render_threads,
+                output_folder=str(output_dir),
+                fmt=render_format,
+                paths_only=True
+            )
+            for page_path in page_paths:
+                yield Path(page_path)
+
+    def _run_pages(self, tasks: Iterable[PageTask]) -> Iterator[PageResult]:
+        """
+        Run stages 2-4 for every task, yielding results in page order.
+
+        With processing.workers > 1 (default: one per CPU) pages are spread
+        over a process pool; each worker loads its own engines once. Tesseract
+        should then run single-threaded (omp_thread_limit: 1) so the workers
+        don't compete for cores.
+
+        With processing.ocr_batch_size > 1 pages are OCR'd that many at a
+        time through recognize_batch_to_hocr(), so the tesseract CLI loads
+        its model once per batch rather than once per page.
+
+        tasks is consumed lazily: at most two batches per worker are queued
+        ahead of the result being waited for.
+        """
+        workers = self.config['processing'].get('workers') or os.cpu_count() or 1
+        batches = _batched(tasks, self.config['processing'].get('ocr_batch_size') or 1)
+
+        if workers <= 1:
+            yield from self._run_pages_overlapped(batches)
+            return
+
+        executor = self._get_executor(workers)
+        pending = deque()
+        try:
+            for batch in batches:
+                pending.append(executor.submit(_process_page_batch, batch))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next document
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            # Don't leave an aborted document's pages queued for the next one
+            for future in pending:
+                future.cancel()
+
+    def _get_executor(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Return the worker pool, starting it on first use.
+
+        The pool outlives a single document so worker processes load their
+        engines once per pipeline rather than once per PDF.
+        """
+        if self._executor is not None and self._executor_workers != workers:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._executor is None:
+            Print("INFO", f"Processing pages with {workers} worker processes")
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.config, self._engine_names, debug_enabled())
+            )
+            self._executor_workers = workers
+
+        return self._executor
+
+    def _new_job_dir(self, keep_temp: bool) -> Path:
+        """Create a scratch directory for one document inside the run's temp dir."""
+        if keep_temp:
+            self._keep_temp_dir = True
+        return Path(tempfile.mkdtemp(prefix='job_', dir=self.temp_dir))
+
+    def _run_pages_overlapped(
+        self,
+        batches: Iterable[List[PageTask]]
+    ) -> Iterator[PageResult]:
+        """
+        Run stages 2-4 in this process with OCR and page preparation overlapped.
+
+        A thread renders (by consuming batches), OCRs and dehyphenates pages
+        while the caller's thread compresses the previous ones. Tesseract and
+        the JPEG2000 encoder both run outside the GIL, so the two stages
+        share the CPU without a process pool. A bounded queue keeps the OCR
+        thread at most _OVERLAP_DEPTH pages ahead.
+        """
+        engines = (self.ocr_engine, self.pdf_engine, self.compressor, self.dehyphenator)
+        ready = queue.Queue(maxsize=_OVERLAP_DEPTH)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            # Give up once the consumer is gone instead of blocking forever
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def recognize_all() -> None:
+            try:
+                for batch in batches:
+                    recognized = _recognize_pages(engines, batch)
+                    for i, (task, page) in enumerate(zip(batch, recognized)):
+                        if not put((task, page)):
+                            for _, _, img in recognized[i:]:
+                                img.close()
+                            return
+                put(None)
+            except BaseException as e:
+                put(e)
+
+        producer = threading.Thread(target=recognize_all, name="morphic-ocr", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = ready.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                task, recognized = item
+                yield _prepare_page(engines, task, *recognized)
+        finally:
+            stop.set()
+            producer.join()
+
     def process_images(
         self,
         image_paths: List[Path],
@@ -347,63 +754,40 @@ class MorphicPipeline:
         if not image_paths:
             raise ValueError("No image paths provided")
 
-        start_time = datetime.now()
-        total_input_size = sum(Path(p).stat().st_size for p in image_paths)
+        start_ns = time.perf_counter_ns()
+        total_input_size = sum(os.stat(p).st_size for p in image_paths)
 
         Print("STATE", f"Processing {len(image_paths)} images")
         Print("INFO", f"Resolution: {dpi} DPI")
 
-        pdf_pages = []
-        total_dehyphenated = 0
-
-        for page_num, img_path in enumerate(image_paths, 1):
-            img_path = Path(img_path)
-            Print("PROGRESS", f"Processing image {page_num}/{len(image_paths)}: {img_path.name}")
-
-            # Load image
-            img = Image.open(img_path)
-
-            # Create temp path for hOCR
-            page_base = self.temp_dir / f"page_{page_num}"
-
-            # OCR
-            hocr_path = self.ocr_engine.recognize_to_hocr(
-                img,
-                output_path=page_base
+        job_dir = self._new_job_dir(keep_temp)
+        tasks = [
+            PageTask(
+                page_num, Path(img_path), job_dir / f"page_{page_num}", dpi,
+                self._dehyphenation_enabled, delete_image=False, keep_temp=keep_temp
             )
+            for page_num, img_path in enumerate(image_paths, 1)
+        ]
 
-            # Dehyphenate
-            if self.config['processing']['dehyphenation'].get('enabled', True):
-                merged = self.dehyphenator.process_file(hocr_path)
-                total_dehyphenated += merged
-
-            # Create PDF page
-            page_pdf = self.pdf_engine.create_searchable_page(
-                image_path=img_path,
-                hocr_path=hocr_path,
-                dpi=dpi,
-                compressor=self.compressor
-            )
-            pdf_pages.append(page_pdf)
+        total_dehyphenated = 0
 
-            # Cleanup
-            if not keep_temp:
-                hocr_path.unlink(missing_ok=True)
+        with self.pdf_engine.open_output(output_pdf) as output:
+            for result in self._run_pages(tasks):
+                Print("PROGRESS", f"Processed image {result.page_num}/{len(image_paths)}: "
+                                  f"{tasks[result.page_num - 1].image_path.name}")
+                output.add_prepared_page(result.prepared, self.compressor)
+                total_dehyphenated += result.dehyphenated
 
-        # Merge and save
-        Print("PROGRESS", "Merging pages...")
-        final_pdf = self.pdf_engine.merge_pages(pdf_pages)
-        output_pdf.parent.mkdir(parents=True, exist_ok=True)
-        final_pdf.save(str(output_pdf))
+            # Saved on leaving the with block
+            Print("PROGRESS", "Saving PDF...")
 
         # Cleanup
-        if not keep_temp and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if not keep_temp:
+            shutil.rmtree(job_dir, ignore_errors=True)
 
         # Statistics
-        end_time = datetime.now()
-        output_size = output_pdf.stat().st_size
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        output_size = os.stat(output_pdf).st_size
 
         stats = {
             'pages': len(image_paths),
@@ -442,21 +826,28 @@ Examples:
     parser.add_argument('--last-page', type=int, default=None, help='Last page to process')
     parser.add_argument('--keep-temp', action='store_true', help='Keep temporary files')
     parser.add_argument('--config', type=Path, default=None, help='Path to config.json')
+    parser.add_argument('--ocr-engine', default='tesseract', choices=['tesseract', 'tesserocr'],
+                        help='OCR engine (default: tesseract; tesserocr falls back to the CLI '
+                             'when not installed)')
+    parser.add_argument('--quiet', action='store_true', help='Suppress DEBUG output')
 
     args = parser.parse_args()
 
+    if args.quiet:
+        set_debug_enabled(False)
+
     try:
-        pipeline = MorphicPipeline(config_path=args.config)
-        pipeline.initialize()
-
-        stats = pipeline.process_pdf(
-            input_pdf=args.input,
-            output_pdf=args.output,
-            dpi=args.dpi,
-            first_page=args.first_page,
-            last_page=args.last_page,
-            keep_temp=args.keep_temp
-        )
+        with MorphicPipeline(config_path=args.config) as pipeline:
+            pipeline.initialize(ocr_engine_name=args.ocr_engine)
+
+            stats = pipeline.process_pdf(
+                input_pdf=args.input,
+                output_pdf=args.output,
+                dpi=args.dpi,
+                first_page=args.first_page,
+                last_page=args.last_page,
+                keep_temp=args.keep_temp
+            )
 
         return 0
 
@@ -25,16 +25,17 @@ This dramatically improves RAG retrieval quality for academic documents.
 
 from lxml import etree
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 import copy
+import re
 
 # Import utilities for logging
 import sys
 repo_root = Path(__file__).resolve().parent.parent
 if str(repo_root) not in sys.path:
     sys.path.insert(0, str(repo_root))
-from utilities import Print
+from utilities import Print, debug_enabled
 
 # Try to import enchant for dictionary validation
 try:
@@ -44,10 +45,29 @@ except ImportError:
     ENCHANT_AVAILABLE = False
     Print("WARNING", "pyenchant not installed - dehyphenation will use heuristics only")
 
+# Parsers built once and shared by every file processed, without entity
+# expansion (and, for HTML, ID collection). The XML parser keeps collecting
+# IDs: without that libxml2 tries to fetch the XHTML DTD Tesseract declares.
+_HOCR_PARSER = etree.XMLParser(resolve_entities=False, huge_tree=True)
+_HOCR_HTML_PARSER = etree.HTMLParser(recover=True, collect_ids=False, huge_tree=True)
 
-@dataclass
+# hOCR queries, compiled once at import instead of on every xpath() call.
+# Namespaced XHTML (Tesseract's output) is tried first, then any element
+# with the class for plain HTML documents.
+_XHTML_NS = {'x': 'http://www.w3.org/1999/xhtml'}
+_LINE_XPATH = etree.XPath('//x:span[@class="ocr_line"]', namespaces=_XHTML_NS)
+_LINE_XPATH_ANY = etree.XPath('//*[@class="ocr_line"]')
+_WORD_XPATH = etree.XPath('.//x:span[@class="ocrx_word"]', namespaces=_XHTML_NS)
+_WORD_XPATH_ANY = etree.XPath('.//*[@class="ocrx_word"]')
+
+# A word whose text ends in a hyphen: '-' right before a closing or child
+# tag. Files without one cannot produce a merge and are not parsed at all.
+_HYPHEN_BEFORE_TAG_RE = re.compile(rb'-\s*<')
+
+
+@dataclass(slots=True)
 class BoundingBox:
-    """Represents a bounding box from hOCR."""
+    """Represents a bounding box from hOCR (one per element, so no __dict__)."""
     x1: int
     y1: int
     x2: int
@@ -124,6 +144,10 @@ class Dehyphenator:
         else:
             self.dictionary = None
 
+        # Dictionary verdict per merged word (confidence, or None to reject).
+        # Hyphenated words recur across pages and suggest() is slow.
+        self._confidence_cache: Dict[str, Optional[float]] = {}
+
     def process_file(self, hocr_path: Path, output_path: Optional[Path] = None) -> int:
         """
         Process hOCR file to merge hyphenated words.
@@ -142,10 +166,23 @@ class Dehyphenator:
         if output_path is None:
             output_path = hocr_path
 
-        Print("DEBUG", f"Processing {hocr_path.name} for dehyphenation")
+        if debug_enabled():
+            Print("DEBUG", f"Processing {hocr_path.name} for dehyphenation")
+
+        # Most pages have no line ending in a hyphen; a byte scan finds
+        # that without building a DOM or rewriting the file
+        try:
+            data = hocr_path.read_bytes()
+        except OSError as e:
+            Print("FAILURE", f"Failed to read hOCR: {e}")
+            return 0
+        if not _HYPHEN_BEFORE_TAG_RE.search(data):
+            if debug_enabled():
+                Print("DEBUG", "No hyphenated words found")
+            return 0
 
         # Parse hOCR
-        tree = self._parse_hocr(hocr_path)
+        tree = self._parse_hocr(data)
         if tree is None:
             return 0
 
@@ -156,7 +193,8 @@ class Dehyphenator:
             Print("DEBUG", "No hyphenated words found")
             return 0
 
-        Print("DEBUG", f"Found {len(candidates)} potential merges")
+        if debug_enabled():
+            Print("DEBUG", f"Found {len(candidates)} potential merges")
 
         # Apply merges
         merged_count = self._apply_merges(tree, candidates)
@@ -168,16 +206,15 @@ class Dehyphenator:
 
         return merged_count
 
-    def _parse_hocr(self, hocr_path: Path) -> Optional[etree._ElementTree]:
-        """Parse hOCR file into lxml tree."""
+    def _parse_hocr(self, data: bytes) -> Optional[etree._ElementTree]:
+        """Parse an hOCR document into lxml tree."""
         try:
             # Try XML parser first (preserves namespaces)
             try:
-                return etree.parse(str(hocr_path))
+                return etree.fromstring(data, _HOCR_PARSER).getroottree()
             except etree.XMLSyntaxError:
                 # Fall back to HTML parser
-                parser = etree.HTMLParser(recover=True)
-                return etree.parse(str(hocr_path), parser)
+                return etree.fromstring(data, _HOCR_HTML_PARSER).getroottree()
         except Exception as e:
             Print("FAILURE", f"Failed to parse hOCR: {e}")
             return None
@@ -194,32 +231,19 @@ class Dehyphenator:
         """
         candidates = []
 
-        # Namespace handling for XHTML hOCR
-        ns = {'x': 'http://www.w3.org/1999/xhtml'}
-
         # Get all lines
-        lines = tree.xpath('//x:span[@class="ocr_line"]', namespaces=ns)
-        if not lines:
-            lines = tree.xpath('//*[@class="ocr_line"]')
+        lines = _LINE_XPATH(tree) or _LINE_XPATH_ANY(tree)
 
         if not lines:
             Print("DEBUG", "No lines found in hOCR")
             return candidates
 
-        # Process consecutive line pairs
-        for i in range(len(lines) - 1):
-            current_line = lines[i]
-            next_line = lines[i + 1]
-
-            # Get words in each line
-            current_words = current_line.xpath('.//x:span[@class="ocrx_word"]', namespaces=ns)
-            if not current_words:
-                current_words = current_line.xpath('.//*[@class="ocrx_word"]')
-
-            next_words = next_line.xpath('.//x:span[@class="ocrx_word"]', namespaces=ns)
-            if not next_words:
-                next_words = next_line.xpath('.//*[@class="ocrx_word"]')
+        # Get words in each line once; every line is both the "next" line of
+        # one pair and the "current" line of the following pair
+        line_words = [_WORD_XPATH(line) or _WORD_XPATH_ANY(line) for line in lines]
 
+        # Process consecutive line pairs
+        for current_words, next_words in zip(line_words, line_words[1:]):
             if not current_words or not next_words:
                 continue
 
@@ -271,19 +295,16 @@ class Dehyphenator:
         confidence = 0.5  # Default confidence without dictionary
 
         if self.dictionary:
-            if self.dictionary.check(merged_text):
-                confidence = 0.95
-            elif self.dictionary.check(merged_text.lower()):
-                confidence = 0.90
+            if merged_text in self._confidence_cache:
+                confidence = self._confidence_cache[merged_text]
             else:
-                # Check if it could be a valid word with suggestions
-                suggestions = self.dictionary.suggest(merged_text)
-                if merged_text.lower() in [s.lower() for s in suggestions[:5]]:
-                    confidence = 0.7
-                else:
-                    # Not in dictionary - likely not a valid merge
+                confidence = self._dictionary_confidence(merged_text)
+                self._confidence_cache[merged_text] = confidence
+            if confidence is None:
+                # Not in dictionary - likely not a valid merge
+                if debug_enabled():
                     Print("DEBUG", f"Rejected merge: '{first_text}' + '{second_text}' = '{merged_text}' (not in dictionary)")
-                    return None
+                return None
         else:
             # Heuristic validation without dictionary
             # Accept if it looks like a reasonable word
@@ -295,7 +316,8 @@ class Dehyphenator:
         first_bbox = self._parse_bbox(first_elem.get('title', ''))
         second_bbox = self._parse_bbox(second_elem.get('title', ''))
 
-        Print("DEBUG", f"Candidate merge: '{first_text}' + '{second_text}' = '{merged_text}' (confidence: {confidence:.2f})")
+        if debug_enabled():
+            Print("DEBUG", f"Candidate merge: '{first_text}' + '{second_text}' = '{merged_text}' (confidence: {confidence:.2f})")
 
         return MergeCandidate(
             first_word_element=first_elem,
@@ -308,6 +330,19 @@ class Dehyphenator:
             confidence=confidence
         )
 
+    def _dictionary_confidence(self, merged_text: str) -> Optional[float]:
+        """Confidence that merged_text is a real word, or None if it is not."""
+        if self.dictionary.check(merged_text):
+            return 0.95
+        if self.dictionary.check(merged_text.lower()):
+            return 0.90
+
+        # Check if it could be a valid word with suggestions
+        suggestions = self.dictionary.suggest(merged_text)
+        if merged_text.lower() in [s.lower() for s in suggestions[:5]]:
+            return 0.7
+        return None
+
     def _apply_merges(self, tree: etree._ElementTree, candidates: List[MergeCandidate]) -> int:
         """
         Apply all valid merges to the hOCR tree.
@@ -347,7 +382,8 @@ class Dehyphenator:
                 if parent is not None:
                     parent.remove(second_elem)
 
-                Print("DEBUG", f"Merged: '{candidate.first_text}' + '{candidate.second_text}' -> '{candidate.merged_text}'")
+                if debug_enabled():
+                    Print("DEBUG", f"Merged: '{candidate.first_text}' + '{candidate.second_text}' -> '{candidate.merged_text}'")
                 merged_count += 1
 
             except Exception as e:
@@ -358,15 +394,7 @@ class Dehyphenator:
     def _get_word_text(self, element: etree._Element) -> str:
         """Extract text content from a word element."""
         # Get all text including from child elements
-        text_parts = []
-        if element.text:
-            text_parts.append(element.text)
-        for child in element:
-            if child.text:
-                text_parts.append(child.text)
-            if child.tail:
-                text_parts.append(child.tail)
-        return ''.join(text_parts).strip()
+        return ''.join(element.itertext()).strip()
 
     def _parse_bbox(self, title: str) -> BoundingBox:
         """Parse bounding box from hOCR title attribute."""
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Functional Test for the lazy engine registries
+
+Built-in engines register on first lookup. This test verifies that:
+1. A built-in name resolves without importing its module up front
+2. A built-in whose module fails to import re-raises that ImportError
+3. An unknown name raises ValueError listing only registered names
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+import engines.ocr as ocr_registry
+from engines.ocr import get_ocr_engine_factory
+from utilities import Print
+
+
+def test_builtin_lookup():
+    """Looking up a built-in name imports and registers it."""
+    Print("HEADER", "=== Engine Registry Test ===")
+
+    factory = get_ocr_engine_factory("tesseract")
+    assert callable(factory)
+    assert "tesseract" in ocr_registry.OCR_REGISTRY
+
+    Print("SUCCESS", "Built-in engine registered on first lookup")
+
+
+def test_failed_import_is_reraised():
+    """The ImportError of a built-in module surfaces when its name is requested."""
+    # A built-in entry whose module cannot be imported
+    ocr_registry._BUILTIN_MODULES['broken'] = 'not_an_engine_module'
+    try:
+        for _ in range(2):
+            # The second lookup must report the same error, not "unknown engine"
+            try:
+                get_ocr_engine_factory("broken")
+            except ImportError as e:
+                assert "'broken' is unavailable" in str(e), str(e)
+                assert isinstance(e.__cause__, ImportError), repr(e.__cause__)
+            else:
+                raise AssertionError("missing engine module was not reported")
+    finally:
+        del ocr_registry._BUILTIN_MODULES['broken']
+        ocr_registry._IMPORTED.discard('not_an_engine_module')
+        ocr_registry._IMPORT_ERRORS.pop('not_an_engine_module', None)
+
+    Print("SUCCESS", "Failed built-in import re-raised with its cause")
+
+
+def test_unknown_name_lists_registered():
+    """Unknown names are rejected with the names that actually registered."""
+    try:
+        get_ocr_engine_factory("no_such_engine")
+    except ValueError as e:
+        available = str(e).split("Available engines: ", 1)[1].split(', ')
+        assert sorted(available) == sorted(ocr_registry.OCR_REGISTRY), available
+    else:
+        raise AssertionError("unknown engine name was accepted")
+
+    Print("SUCCESS", "Unknown engine rejected with registered names only")
+
+
+if __name__ == "__main__":
+    try:
+        test_builtin_lookup()
+        test_failed_import_is_reraised()
+        test_unknown_name_lists_registered()
+    except AssertionError as e:
+        Print("FAILURE", f"Engine registry test FAILED: {e}")
+        sys.exit(1)
+    Print("COMPLETED", "Engine registry test PASSED")
+    sys.exit(0)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Functional Test for batch hOCR splitting
+
+A batched Tesseract run returns one hOCR document with an ocr_page div per
+image. This test verifies that TesseractEngine splits it into:
+1. One file per page, in image order
+2. Files that each hold exactly one ocr_page and parse as full hOCR documents
+3. A RuntimeError when the page count does not match the expected paths
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from engines.ocr.tesseract import TesseractEngine
+from lxml import etree
+from utilities import Print
+import json
+
+
+HOCR_NS = {'x': 'http://www.w3.org/1999/xhtml'}
+
+
+def _batch_hocr(words):
+    """Build a multi-page hOCR document with one word per page."""
+    pages = ''.join(
+        f"  <div class='ocr_page' id='page_{i}' title='image \"page_{i}.bmp\"; bbox 0 0 800 200; ppageno {i - 1}'>\n"
+        f"   <span class='ocrx_word' id='word_{i}_1' title='bbox 50 50 150 70; x_wconf 95'>{word}</span>\n"
+        f"  </div>\n"
+        for i, word in enumerate(words, start=1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n'
+        ' <head>\n'
+        '  <title></title>\n'
+        "  <meta name='ocr-system' content='tesseract 5.3.0' />\n"
+        ' </head>\n'
+        ' <body>\n'
+        f'{pages}'
+        ' </body>\n'
+        '</html>\n'
+    ).encode('utf-8')
+
+
+def _engine():
+    with open(repo_root / "config" / "config.json") as f:
+        config = json.load(f)
+    return TesseractEngine(config['ocr_engines']['tesseract'])
+
+
+def test_split_hocr_pages():
+    """Each page of a batch hOCR lands in its own file, in order."""
+    Print("HEADER", "=== Batch hOCR Split Test ===")
+
+    words = ["alpha", "bravo", "charlie"]
+    engine = _engine()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        hocr_paths = [Path(tmp) / f"page_{i}.hocr" for i in range(len(words))]
+        engine._split_hocr_pages(_batch_hocr(words), hocr_paths)
+
+        for i, (word, hocr_path) in enumerate(zip(words, hocr_paths), start=1):
+            tree = etree.parse(str(hocr_path))
+            pages = tree.xpath('//x:div[@class="ocr_page"]', namespaces=HOCR_NS)
+            assert len(pages) == 1, f"{hocr_path.name}: {len(pages)} ocr_page divs"
+            assert pages[0].get('id') == f"page_{i}"
+
+            page_words = tree.xpath('//x:span[@class="ocrx_word"]/text()', namespaces=HOCR_NS)
+            assert page_words == [word], f"{hocr_path.name}: {page_words}"
+
+            # The document skeleton is kept so each file parses like a single-image run
+            assert tree.xpath('/x:html/x:head/x:meta', namespaces=HOCR_NS)
+
+    Print("SUCCESS", f"Split {len(words)} pages into per-page hOCR files")
+
+
+def test_split_hocr_page_count_mismatch():
+    """A batch that returned fewer pages than images is an error."""
+    engine = _engine()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        hocr_paths = [Path(tmp) / f"page_{i}.hocr" for i in range(3)]
+        try:
+            engine._split_hocr_pages(_batch_hocr(["alpha", "bravo"]), hocr_paths)
+        except RuntimeError as e:
+            assert "Expected 3 pages" in str(e), str(e)
+        else:
+            raise AssertionError("page count mismatch was not reported")
+
+    Print("SUCCESS", "Page count mismatch raises RuntimeError")
+
+
+if __name__ == "__main__":
+    try:
+        test_split_hocr_pages()
+        test_split_hocr_page_count_mismatch()
+    except AssertionError as e:
+        Print("FAILURE", f"Batch hOCR split test FAILED: {e}")
+        sys.exit(1)
+    Print("COMPLETED", "Batch hOCR split test PASSED")
+    sys.exit(0)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Functional Test for streamed PDF output
+
+Writes pages through PikePDFEngine.open_output() with a flush after every
+page to verify that saving and reopening the document:
+1. Keeps every page, in the order it was added
+2. Keeps one /Font resource dictionary shared by all pages
+3. Leaves no scratch files next to the output
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from engines.compression import get_compressor
+from engines.pdf import get_pdf_engine
+from PIL import Image
+from utilities import Print
+import json
+import pikepdf
+
+
+def _page_hocr(word):
+    """Single-page hOCR with one word."""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><body>\n'
+        "<div class='ocr_page' title='bbox 0 0 600 400'>\n"
+        "<span class='ocr_line' title='bbox 50 50 250 80'>\n"
+        f"<span class='ocrx_word' title='bbox 50 50 250 80'>{word}</span>\n"
+        '</span></div></body></html>\n'
+    ).encode('utf-8')
+
+
+def test_flush_round_trip():
+    """Flushing after every page keeps page order and the shared fonts."""
+    Print("HEADER", "=== Streamed PDF Output Test ===")
+
+    with open(repo_root / "config" / "config.json") as f:
+        config = json.load(f)
+
+    pdf_config = dict(config['pdf_engines']['pikepdf'], flush_every=1)
+    engine = get_pdf_engine("pikepdf", pdf_config)
+    compressor = get_compressor("jpeg2000", config['compression']['jpeg2000'])
+
+    dpi = 300
+    widths = [600, 640, 680, 720]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        output_path = tmp / "out.pdf"
+
+        Print("PROGRESS", f"Step 1: Writing {len(widths)} pages, flushing after each...")
+        with engine.open_output(output_path) as output:
+            for i, width in enumerate(widths):
+                image_path = tmp / f"page_{i}.png"
+                Image.new('RGB', (width, 400), 'white').save(image_path)
+                output.add_page(image_path, _page_hocr(f"page{i}"), dpi, compressor)
+
+        leftovers = sorted(p.name for p in tmp.iterdir() if p.suffix == '.partial')
+        assert not leftovers, f"scratch files left behind: {leftovers}"
+
+        Print("PROGRESS", "Step 2: Checking the saved document...")
+        with pikepdf.open(output_path) as pdf:
+            assert len(pdf.pages) == len(widths), f"{len(pdf.pages)} pages"
+
+            page_widths = [round(float(page.MediaBox[2]) * dpi / 72) for page in pdf.pages]
+            assert page_widths == widths, f"page order changed: {page_widths}"
+
+            for i, page in enumerate(pdf.pages):
+                assert f"page{i}".encode() in page.Contents.read_bytes()
+
+            fonts = {page.Resources.Font.objgen for page in pdf.pages}
+            assert len(fonts) == 1, f"pages use {len(fonts)} /Font dictionaries"
+
+    Print("SUCCESS", "Pages kept in order and sharing one /Font dictionary")
+
+
+if __name__ == "__main__":
+    try:
+        test_flush_round_trip()
+    except AssertionError as e:
+        Print("FAILURE", f"Streamed PDF output test FAILED: {e}")
+        sys.exit(1)
+    Print("COMPLETED", "Streamed PDF output test PASSED")
+    sys.exit(0)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Functional Test for Tesseract image preparation
+
+Transparent pages are flattened onto white before OCR. This test verifies
+that the flattened image keeps the source DPI, which OCR downscaling
+(ocr_dpi) and Tesseract's --dpi argument are derived from.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+repo_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(repo_root))
+
+from engines.ocr.tesseract import TesseractEngine
+from PIL import Image
+from utilities import Print
+import json
+
+
+def _engine():
+    with open(repo_root / "config" / "config.json") as f:
+        config = json.load(f)
+    return TesseractEngine(config['ocr_engines']['tesseract'])
+
+
+def _transparent_page(mode):
+    """A page of the given mode with a half-transparent corner and 600 DPI metadata."""
+    image = Image.new(mode, (200, 100), (0,) * (len(mode) - 1) + (255,))
+    image.paste((0,) * (len(mode) - 1) + (128,), (0, 0, 50, 50))
+    image.info['dpi'] = (600, 600)
+    return image
+
+
+def test_rgba_keeps_dpi():
+    """Flattening an RGBA page keeps its DPI."""
+    Print("HEADER", "=== Image Preparation Test ===")
+
+    prepared = _engine()._prepare_image(_transparent_page('RGBA'))
+    assert prepared.info.get('dpi') == (600, 600), prepared.info
+
+    Print("SUCCESS", "RGBA page flattened with its DPI")
+
+
+def test_la_keeps_dpi():
+    """Flattening a gray LA page keeps its DPI."""
+    prepared = _engine()._prepare_image(_transparent_page('LA'))
+    assert prepared.mode == 'L', prepared.mode
+    assert prepared.info.get('dpi') == (600, 600), prepared.info
+
+    Print("SUCCESS", "LA page flattened with its DPI")
+
+
+if __name__ == "__main__":
+    try:
+        test_rgba_keeps_dpi()
+        test_la_keeps_dpi()
+    except AssertionError as e:
+        Print("FAILURE", f"Image preparation test FAILED: {e}")
+        sys.exit(1)
+    Print("COMPLETED", "Image preparation test PASSED")
+    sys.exit(0)
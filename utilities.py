@@ -1,4 +1,8 @@
-import inspect
+import atexit
+import multiprocessing.util
+import queue
+import sys
+import threading
 import time
 from datetime import datetime, timezone
 import os
@@ -6,70 +10,102 @@ import os
 import psutil
 from rich import print as _print
 
+# DEBUG output is on unless MORPHIC_DEBUG=0; hot paths check debug_enabled()
+# before building their messages so disabled output costs nothing.
+_DEBUG_ENABLED = os.environ.get('MORPHIC_DEBUG', '1').lower() not in ('0', 'false', 'no', 'off')
+
+
+# With MORPHIC_ASYNC_LOG=1 formatted lines are handed to a background thread
+# that does the terminal writes, so a slow console never stalls the page loop.
+# Each process (including pool workers) gets its own writer thread.
+_ASYNC_LOG = os.environ.get('MORPHIC_ASYNC_LOG', '0').lower() in ('1', 'true', 'yes', 'on')
+_log_queue: "queue.SimpleQueue[str | None] | None" = None
+_log_writer: "threading.Thread | None" = None
+_log_lock = threading.Lock()
+
+# Mapping of logType to symbols
+_LOG_TYPE_SYMBOLS = {
+    'SUCCESS': ('^^^', '^^^'),
+    'FAILURE': ('###', '###'),
+    'STATE': ('~~~', '~~~'),
+    'INFO': ('---', '---'),
+    'IMPORTANT': ('===', '==='),
+    'CRITICAL': ('***', '***'),  # Changed symbols for CRITICAL
+    'EXCEPTION': ('!!!', '!!!'),
+    'WARNING': ('(((', ')))'),
+    'DEBUG': ('[[[', ']]]'),
+    'ATTEMPT': ('???', '???'),
+    'STARTING': ('>>>', '>>>'),
+    'PROGRESS': ('vvv', 'vvv'),
+    'COMPLETED': ('<<<', '<<<'),
+}
+
+# Mapping of logType to styles
+_LOG_TYPE_STYLES = {
+    'SUCCESS': 'green',
+    'FAILURE': 'red bold',
+    'STATE': 'cyan',
+    'INFO': 'blue',
+    'IMPORTANT': 'magenta',
+    'CRITICAL': 'red bold',
+    'EXCEPTION': 'red bold',
+    'WARNING': 'yellow',
+    'DEBUG': 'white',
+    'ATTEMPT': 'cyan',
+    'STARTING': 'green',
+    'PROGRESS': 'blue',
+    'COMPLETED': 'green',
+}
+
+
+def debug_enabled() -> bool:
+    """
+    Returns True if DEBUG messages are currently printed.
+    """
+    return _DEBUG_ENABLED
+
+
+def set_debug_enabled(enabled: bool) -> None:
+    """
+    Turns DEBUG output on or off for the whole process.
+    """
+    global _DEBUG_ENABLED
+    _DEBUG_ENABLED = bool(enabled)
+
+
 def Print(logType: str, message: str) -> None:
     """
     Prints a log message with timestamp, function name, symbols wrapping the logType, and the message.
     """
-    try:
-        # Mapping of logType to symbols
-        logTypeSymbols = {
-            'SUCCESS': ('^^^', '^^^'),
-            'FAILURE': ('###', '###'),
-            'STATE': ('~~~', '~~~'),
-            'INFO': ('---', '---'),
-            'IMPORTANT': ('===', '==='),
-            'CRITICAL': ('***', '***'),  # Changed symbols for CRITICAL
-            'EXCEPTION': ('!!!', '!!!'),
-            'WARNING': ('(((', ')))'),
-            'DEBUG': ('[[[', ']]]'),
-            'ATTEMPT': ('???', '???'),
-            'STARTING': ('>>>', '>>>'),
-            'PROGRESS': ('vvv', 'vvv'),
-            'COMPLETED': ('<<<', '<<<'),
-        }
-
-        # Mapping of logType to styles
-        logTypeStyles = {
-            'SUCCESS': 'green',
-            'FAILURE': 'red bold',
-            'STATE': 'cyan',
-            'INFO': 'blue',
-            'IMPORTANT': 'magenta',
-            'CRITICAL': 'red bold',
-            'EXCEPTION': 'red bold',
-            'WARNING': 'yellow',
-            'DEBUG': 'white',
-            'ATTEMPT': 'cyan',
-            'STARTING': 'green',
-            'PROGRESS': 'blue',
-            'COMPLETED': 'green',
-        }
+    if not _DEBUG_ENABLED and logType.upper() == 'DEBUG':
+        return
 
+    try:
         # Get current timestamp with microseconds
         current_time = time.time()
         timestamp = datetime.fromtimestamp(current_time, tz=timezone.utc).isoformat(timespec='microseconds') + 'Z'
 
         # Get symbols for the logType
         logTypeUpper = logType.upper()
-        symbols = logTypeSymbols.get(logTypeUpper, ('', ''))
+        symbols = _LOG_TYPE_SYMBOLS.get(logTypeUpper, ('', ''))
         before_symbol, after_symbol = symbols
 
         # Construct the formatted logType with symbols
         formattedLogType = f"{before_symbol} {logTypeUpper} {after_symbol}"
 
         # Apply style if available
-        style = logTypeStyles.get(logTypeUpper, '')
+        style = _LOG_TYPE_STYLES.get(logTypeUpper, '')
         if style:
             formattedLogType = f"[{style}]{formattedLogType}[/{style}]"
 
-        # Get the caller function name
-        caller_frame = inspect.stack()[1]
-        function_name = caller_frame.function
+        # Get the caller function name (sys._getframe, unlike inspect.stack(),
+        # doesn't read source lines for every frame on the stack)
+        caller_frame = sys._getframe(1)
+        function_name = caller_frame.f_code.co_name
 
         # If the caller is Print, get the next frame
         if function_name == 'Print':
-            caller_frame = inspect.stack()[2]
-            function_name = caller_frame.function
+            function_name = caller_frame.f_back.f_code.co_name
 
         # Pad the function name for alignment (optional)
         functionNamePadding = 40
@@ -78,14 +114,75 @@ def Print(logType: str, message: str) -> None:
         # Construct the output line
         output_line = f"{timestamp} {formattedLogType} {paddedFunctionName} {message}"
 
-        # Print the output using rich
-        _print(output_line)
+        # Print the output using rich, on the writer thread if enabled
+        if _ASYNC_LOG:
+            _enqueue_log_line(output_line)
+        else:
+            _print(output_line)
 
     except Exception as e:
         error_message = f"Something went wrong when attempting to print.\nError: {e}"
         print(error_message)
 
 
+def _enqueue_log_line(line: str) -> None:
+    """
+    Hands a formatted line to the log writer thread, starting it on first use.
+    """
+    global _log_queue, _log_writer
+    if _log_writer is None or not _log_writer.is_alive():
+        with _log_lock:
+            if _log_writer is None or not _log_writer.is_alive():
+                _log_queue = queue.SimpleQueue()
+                _log_writer = threading.Thread(
+                    target=_write_log_lines, args=(_log_queue,),
+                    name="morphic-log", daemon=True
+                )
+                _log_writer.start()
+    _log_queue.put(line)
+
+
+def _write_log_lines(lines: "queue.SimpleQueue[str | None]") -> None:
+    """
+    Log writer thread: prints queued lines until the None sentinel.
+    """
+    while (line := lines.get()) is not None:
+        try:
+            _print(line)
+        except Exception as e:
+            print(f"Something went wrong when attempting to print.\nError: {e}")
+
+
+def flush_log() -> None:
+    """
+    Waits until every queued log line has been written. Runs at exit.
+    """
+    global _log_writer
+    with _log_lock:
+        writer, _log_writer = _log_writer, None
+    if writer is not None and writer.is_alive():
+        _log_queue.put(None)
+        writer.join()
+
+
+def _reset_log_writer() -> None:
+    """
+    Gives a forked child (e.g. a pool worker) its own writer thread. Pool
+    workers leave through os._exit(), which skips atexit, so the flush is
+    registered as a multiprocessing finalizer too.
+    """
+    global _log_queue, _log_writer, _log_lock
+    _log_queue = None
+    _log_writer = None
+    _log_lock = threading.Lock()
+    multiprocessing.util.Finalize(None, flush_log, exitpriority=100)
+
+
+atexit.register(flush_log)
+if _ASYNC_LOG:
+    os.register_at_fork(after_in_child=_reset_log_writer)
+
+
 def CPU_and_Mem_usage() -> str:
     """
     Returns a string with the CPU usage and memory usage of the current process.